@@ -0,0 +1,72 @@
+"""Normalization and precompilation of CLI glob patterns."""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import NamedTuple
+
+from pathspec.patterns.gitwildmatch import GitWildMatchPattern
+
+# Commas separate patterns; surrounding whitespace is not part of a pattern.
+# Inner whitespace is kept so paths containing spaces still work.
+_SEP = re.compile(r"\s*,\s*")
+_SIMPLE = re.compile(r"[^/*]+")
+# gitwildmatch regexes name their directory-marker group; alternation needs
+# anonymous groups or the union fails with a duplicate group name.
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+
+class NormPatterns(NamedTuple):
+  """Normalized glob patterns alongside their precompiled union regex."""
+
+  globs: tuple[str, ...]
+  union: re.Pattern[str] | None
+  """Single alternation of all globs, or None when any glob is negated."""
+
+
+@functools.cache
+def compile_globs(globs: tuple[str, ...]) -> re.Pattern[str] | None:
+  """Compile all globs into one alternation regex, once per process.
+
+  Negated globs (``!pattern``) depend on rule order, which an alternation cannot
+  express, so None is returned and callers fall back to ``pathspec``.
+  """
+  parts: list[str] = []
+  for pat in globs:
+    regex, include = GitWildMatchPattern.pattern_to_regex(pat)
+    if include is False:
+      return None
+    if regex is not None:
+      parts.append(_NAMED_GROUP.sub("(?:", regex))
+  return re.compile("|".join(parts) if parts else r"(?!)")
+
+
+@functools.cache
+def normalize_patterns(patterns: tuple[str, ...] | None) -> NormPatterns | None:
+  """
+  Normalize glob patterns from CLI input.
+
+  - Splits comma-separated values into individual patterns
+  - Adds `**/` prefix to patterns without path separators for recursive matching
+
+  Results are cached, so callers must pass a tuple rather than the list Typer
+  produces.
+  """
+  if not patterns:
+    return None
+
+  result: list[str] = []
+  for p in _SEP.split(",".join(patterns).strip()):
+    if not p:
+      continue
+    # If it's a simple name (no path separator or glob), make it match recursively
+    if _SIMPLE.fullmatch(p):
+      # Match both as a directory and files within
+      result.extend((f"{p}/", f"{p}/**"))
+    else:
+      result.append(p)
+  if not result:
+    return None
+  globs = tuple(result)
+  return NormPatterns(globs, compile_globs(globs))
@@ -0,0 +1,40 @@
+"""Helpers shared by the CLI commands."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+from repo_map.cli._patterns import normalize_patterns
+
+if TYPE_CHECKING:
+  from rich.console import Console
+  from structlog.typing import FilteringBoundLogger
+
+__all__ = ["err_console", "get_logger", "normalize_patterns", "out_console"]
+
+
+@functools.cache
+def err_console() -> Console:
+  """Return the stderr console used for logs and stats."""
+  from rich.console import Console
+
+  return Console(stderr=True)
+
+
+@functools.cache
+def out_console() -> Console:
+  """Return the stdout console used for the actual map data."""
+  from rich.console import Console
+
+  return Console()
+
+
+def get_logger() -> FilteringBoundLogger:
+  """Configure logging and return a logger instance."""
+  import structlog
+
+  from repo_map.logging_config import configure_logging
+
+  configure_logging()
+  return structlog.get_logger()
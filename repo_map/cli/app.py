@@ -2,65 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
-import uuid
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
-import structlog
 import typer
-from pydantic import ValidationError
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 if TYPE_CHECKING:
-  from structlog.typing import FilteringBoundLogger
-
-  from repo_map.navigator.runner import NavigatorOutput
-
-from repo_map.clipboard import copy_to_clipboard
-from repo_map.core.flight_plan import FlightPlan, format_validation_errors
-from repo_map.logging_config import configure_adk_debug_logging, configure_logging
-from repo_map.mapper import generate_repomap
-from repo_map.settings import Settings
-
-# stderr console for logs/stats, stdout console for the actual map data
-err_console = Console(stderr=True)
-out_console = Console()
-
-
-def normalize_patterns(patterns: list[str] | None) -> list[str] | None:
-  """
-  Normalize glob patterns from CLI input.
-
-  - Splits comma-separated values into individual patterns
-  - Adds `**/` prefix to patterns without path separators for recursive matching
-  """
-  if not patterns:
-    return None
-
-  result: list[str] = []
-  for pattern in patterns:
-    # Split comma-separated patterns
-    for p in pattern.split(","):
-      p = p.strip()
-      if not p:
-        continue
-      # If it's a simple name (no path separator or glob), make it match recursively
-      if "/" not in p and "*" not in p:
-        # Match both as a directory and files within
-        result.append(f"{p}/")
-        result.append(f"{p}/**")
-      else:
-        result.append(p)
-  return result if result else None
-
-
-def get_logger() -> FilteringBoundLogger:
-  """Configure logging and return a logger instance."""
-  configure_logging()
-  return structlog.get_logger()
+  from repo_map.core.flight_plan import FlightPlan
 
+from repo_map.cli._shared import (
+  err_console,
+  get_logger,
+  normalize_patterns,
+  out_console,
+)
 
 app = typer.Typer(
   help="Repo Map: Intelligent repository skeleton generator for LLMs.",
@@ -68,6 +24,12 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def main() -> None:
+  """Repo Map: Intelligent repository skeleton generator for LLMs."""
+  # Keeps Typer in multi-command mode even when only `generate` is registered.
+
+
 @app.command()
 def generate(
   path: Annotated[
@@ -131,23 +93,30 @@ def generate(
   """
   Generate a concise skeleton of your repository structure.
   """
+  from repo_map.core.tags import default_cache_dir
+  from repo_map.mapper import generate_repomap
+
   log = get_logger()
 
   # --- Load Flight Plan if provided ---
   flight_plan: FlightPlan | None = None
   if config:
+    from pydantic import ValidationError
+
+    from repo_map.core.flight_plan import FlightPlan, format_validation_errors
+
     try:
       flight_plan = FlightPlan.from_yaml_file(config)
       if not quiet:
         log.info("loaded_flight_plan", path=str(config))
     except FileNotFoundError:
-      err_console.print(f"[red]Error: Flight plan not found: {config}[/red]")
+      err_console().print(f"[red]Error: Flight plan not found: {config}[/red]")
       raise typer.Exit(code=3) from None
     except ValidationError as e:
-      err_console.print(f"[red]{format_validation_errors(e.errors())}[/red]")
+      err_console().print(f"[red]{format_validation_errors(e.errors())}[/red]")
       raise typer.Exit(code=2) from None
     except ValueError as e:
-      err_console.print(f"[red]Error: {e}[/red]")
+      err_console().print(f"[red]Error: {e}[/red]")
       raise typer.Exit(code=2) from None
 
   # --- Determine effective token budget (CLI > FlightPlan > default) ---
@@ -161,318 +130,97 @@ def generate(
 
   try:
     # Normalize patterns to handle comma-separated values and add recursive matching
-    normalized_include = normalize_patterns(include)
-    normalized_exclude = normalize_patterns(exclude)
+    normalized_include = normalize_patterns(tuple(include) if include else None)
+    normalized_exclude = normalize_patterns(tuple(exclude) if exclude else None)
 
     result = generate_repomap(
       root_dir=path,
       token_limit=effective_tokens,
-      include_patterns=normalized_include,
-      exclude_patterns=normalized_exclude,
+      include_patterns=list(normalized_include.globs) if normalized_include else None,
+      exclude_patterns=list(normalized_exclude.globs) if normalized_exclude else None,
+      include_regex=normalized_include.union if normalized_include else None,
+      exclude_regex=normalized_exclude.union if normalized_exclude else None,
       allowed_extensions=extensions,
       use_gitignore=not no_gitignore,
       flight_plan=flight_plan,
       show_costs=show_costs,
       strict=strict,
+      cache_dir=default_cache_dir(),
     )
 
     if not result:
       if not quiet:
-        err_console.print("[yellow]No matching files found.[/yellow]")
+        err_console().print("[yellow]No matching files found.[/yellow]")
       return
 
     # --- Determine Output Content ---
-    sorted_files = sorted(result.files)
+    sorted_files = result.files  # already sorted by the mapper
     map_content = result.content
-    output_content = "\n".join(sorted_files) if summary else map_content
 
     # --- Output Handling ---
     if copy:
-      success = copy_to_clipboard(output_content)
+      from repo_map.clipboard import copy_to_clipboard
+
+      output_data = _encode_output(sorted_files, map_content, summary)
+      success = copy_to_clipboard(output_data)
       if success:
         if not quiet:
-          chars = len(output_content)
+          size = len(output_data)
           label = "summary" if summary else "map"
-          err_console.print(
-            f"[bold green]✓ Copied {label} to clipboard[/bold green] ({chars} chars)"
+          err_console().print(
+            f"[bold green]✓ Copied {label} to clipboard[/bold green] ({size} bytes)"
           )
       else:
-        err_console.print("[red]✗ Clipboard copy failed. Printing to stdout:[/red]")
-        out_console.print(output_content)
+        err_console().print("[red]✗ Clipboard copy failed. Printing to stdout:[/red]")
+        out_console().print(output_data.decode("utf-8"))
 
     elif output_file:
-      output_file.write_text(output_content, encoding="utf-8")
+      output_file.write_bytes(_encode_output(sorted_files, map_content, summary))
       if not quiet:
-        err_console.print(f"[bold green]✓ Saved to {output_file}[/bold green]")
+        err_console().print(f"[bold green]✓ Saved to {output_file}[/bold green]")
 
     else:
       # Default: Print to stdout
-      out_console.print(output_content)
+      out_console().print("\n".join(sorted_files) if summary else map_content)
 
     # --- Summary Statistics (only when not in summary mode and not quiet) ---
     if not quiet and not summary:
-      err_console.print(f"\n[bold]Mapped {len(result.files)} files:[/bold]")
+      err_console().print(f"\n[bold]Mapped {len(result.files)} files:[/bold]")
 
       # A simple list is more copy-pasteable than a rich Tree.
-      for f in sorted_files:
-        err_console.print(f" - {f}", style="dim")
+      listing = "\n".join(f" - {f}" for f in sorted_files)
+      console = err_console()
+      if console.is_terminal:
+        console.print(
+          listing, style="dim", markup=False, highlight=False, soft_wrap=True
+        )
+      else:
+        # Nothing to style when piped; skip Rich rendering entirely
+        sys.stderr.write(listing + "\n")
 
       budget_info = f"Budget: {effective_tokens} | Chars: {len(map_content)}"
-      err_console.print(f"\n[dim]{budget_info}[/dim]")
+      err_console().print(f"\n[dim]{budget_info}[/dim]")
 
   except Exception as e:
     log.error("generation_failed", error=str(e))
-    err_console.print(f"[red]Fatal Error: {e}[/red]")
+    err_console().print(f"[red]Fatal Error: {e}[/red]")
     raise typer.Exit(code=1) from e
 
 
-@app.command()
-def navigate(
-  path: Annotated[
-    Path,
-    typer.Argument(
-      exists=True, file_okay=False, dir_okay=True, help="Root directory to explore"
-    ),
-  ] = Path("."),
-  goal: Annotated[
-    str,
-    typer.Option(
-      "--goal",
-      "-g",
-      help="Description of your task or what you're looking for.",
-    ),
-  ] = "",
-  tokens: Annotated[
-    int | None,
-    typer.Option("--tokens", "-t", help="Maximum token budget for context window."),
-  ] = None,
-  cost_limit: Annotated[
-    float | None,
-    typer.Option("--cost-limit", help="Maximum USD to spend on exploration."),
-  ] = None,
-  model: Annotated[
-    str | None,
-    typer.Option("--model", "-m", help="LLM model to use for navigation."),
-  ] = None,
-  max_iterations: Annotated[
-    int,
-    typer.Option("--max-iterations", help="Maximum exploration iterations."),
-  ] = 20,
-  output_file: Annotated[
-    Path | None,
-    typer.Option("--output", "-o", help="Write context output to a file."),
-  ] = None,
-  flight_plan: Annotated[
-    Path | None,
-    typer.Option("--flight-plan", "-f", help="Export flight plan to YAML."),
-  ] = None,
-  copy: Annotated[
-    bool,
-    typer.Option("--copy", "-c", help="Copy context output to clipboard."),
-  ] = False,
-  quiet: Annotated[
-    bool,
-    typer.Option("--quiet", "-q", help="Suppress progress output."),
-  ] = False,
-  debug: Annotated[
-    bool,
-    typer.Option("--debug", "-d", help="Enable verbose debug output."),
-  ] = False,
-):
-  """
-  Autonomously explore a repository to discover relevant context for your task.
-
-  The Navigator agent iteratively refines its view of the codebase, starting
-  with a broad overview and progressively focusing on areas relevant to your
-  goal. It produces an optimized context window within your token budget.
-
-  Example:
-      repo-map navigate . -g "understand the authentication flow"
-  """
-  log = get_logger()
-  settings = Settings()
-
-  # Configure API key for ADK (bridges GEMINI_API_KEY to GOOGLE_API_KEY)
-  settings.configure_api_key()
-
-  # Configure ADK debug logging if requested
-  debug_log_file = None
-  if debug:
-    debug_log_file = configure_adk_debug_logging()
-    err_console.print(f"[dim]Debug logging enabled → {debug_log_file}[/dim]")
-
-  # Validate goal
-  if not goal:
-    err_console.print("[red]Error: --goal is required for navigation[/red]")
-    raise typer.Exit(code=2)
-
-  # Resolve settings with CLI overrides
-  effective_tokens = tokens or settings.navigator_default_token_budget
-  effective_cost_limit = cost_limit or settings.navigator_default_cost_limit_usd
-  effective_model = model or settings.navigator_model
-
-  # Run the async navigation
-  try:
-    result = asyncio.run(
-      _run_navigation(
-        path=path,
-        goal=goal,
-        tokens=effective_tokens,
-        cost_limit=effective_cost_limit,
-        model=effective_model,
-        max_iterations=max_iterations,
-        quiet=quiet,
-        debug=debug,
-        log=log,
-      )
-    )
-  except Exception as e:
-    log.error("navigation_failed", error=str(e))
-    err_console.print(f"[red]Navigation failed: {e}[/red]")
-    raise typer.Exit(code=1) from e
+def _encode_output(sorted_files: list[str], map_content: str, summary: bool) -> bytes:
+  """Encode the generate output once for the clipboard or an output file."""
+  if summary:
+    return b"\n".join(f.encode("utf-8") for f in sorted_files)
+  return map_content.encode("utf-8")
 
-  if result is None:
-    err_console.print("[yellow]Navigation produced no results.[/yellow]")
-    raise typer.Exit(code=1)
 
-  # Handle output
-  context_output = result.context_string
+# `navigate` pulls in the ADK runner stack, so it is only registered when the
+# invocation could need it. Anything other than `generate` (help, completion,
+# `navigate` itself) sees the full command tree.
+if len(sys.argv) < 2 or sys.argv[1] != "generate":
+  from repo_map.cli.navigate import register_navigate
 
-  if copy:
-    success = copy_to_clipboard(context_output)
-    if success:
-      if not quiet:
-        err_console.print(
-          f"[bold green]✓ Copied context to clipboard[/bold green] "
-          f"({len(context_output)} chars, ~{result.token_count} tokens)"
-        )
-    else:
-      err_console.print("[red]✗ Clipboard copy failed. Printing to stdout:[/red]")
-      out_console.print(context_output)
-  elif output_file:
-    output_file.write_text(context_output, encoding="utf-8")
-    if not quiet:
-      err_console.print(f"[bold green]✓ Saved context to {output_file}[/bold green]")
-  else:
-    out_console.print(context_output)
-
-  # Export flight plan if requested
-  if flight_plan:
-    flight_plan.write_text(result.flight_plan_yaml, encoding="utf-8")
-    if not quiet:
-      err_console.print(f"[bold green]✓ Saved flight plan: {flight_plan}[/bold green]")
-
-  # Print summary unless quiet
-  if not quiet:
-    err_console.print("\n[bold]Navigation Summary:[/bold]")
-    err_console.print(f"  Iterations: {result.total_iterations}")
-    err_console.print(f"  Total cost: ${result.total_cost:.4f}")
-    err_console.print(f"  Token count: ~{result.token_count}")
-    if result.reasoning_summary:
-      err_console.print(f"\n[dim]{result.reasoning_summary}[/dim]")
-    if debug_log_file:
-      err_console.print(f"\n[dim]Full ADK debug logs: {debug_log_file}[/dim]")
-
-
-async def _run_navigation(
-  path: Path,
-  goal: str,
-  tokens: int,
-  cost_limit: float,
-  model: str,
-  max_iterations: int,
-  quiet: bool,
-  debug: bool,
-  log: FilteringBoundLogger,
-) -> NavigatorOutput | None:
-  """Run the Navigator agent asynchronously."""
-  from repo_map.navigator.runner import (
-    NavigatorOutput,
-    NavigatorProgress,
-    create_navigator_runner,
-    initialize_session,
-    run_autonomous,
-  )
-
-  # Generate session identifiers
-  user_id = "cli-user"
-  session_id = str(uuid.uuid4())
-
-  log.info(
-    "starting_navigation",
-    path=str(path),
-    goal=goal[:50],
-    tokens=tokens,
-    cost_limit=cost_limit,
-    model=model,
-    max_iterations=max_iterations,
-  )
-
-  # Create runner
-  runner, budget_plugin = create_navigator_runner(model=model)
-
-  # Initialize session
-  await initialize_session(
-    runner=runner,
-    user_id=user_id,
-    session_id=session_id,
-    repo_path=path,
-    user_task=goal,
-    token_budget=tokens,
-    cost_limit=cost_limit,
-    model=model,
-  )
-
-  result: NavigatorOutput | None = None
-
-  if quiet:
-    # Run without progress display
-    async for item in run_autonomous(
-      runner,
-      budget_plugin,
-      user_id,
-      session_id,
-      max_iterations=max_iterations,
-      debug=debug,
-    ):
-      if isinstance(item, NavigatorOutput):
-        result = item
-  else:
-    # Run with progress display
-    with Progress(
-      SpinnerColumn(),
-      TextColumn("[progress.description]{task.description}"),
-      console=err_console,
-      transient=not debug,  # Keep output visible in debug mode
-    ) as progress:
-      task = progress.add_task("Exploring repository...", total=None)
-
-      async for item in run_autonomous(
-        runner,
-        budget_plugin,
-        user_id,
-        session_id,
-        max_iterations=max_iterations,
-        debug=debug,
-      ):
-        if isinstance(item, NavigatorProgress):
-          if debug:
-            # In debug mode, print detailed progress
-            err_console.print(
-              f"[cyan]Step {item.step}[/cyan]: {item.action} | "
-              f"tokens={item.tokens} | cost=${item.cost_so_far:.4f}"
-            )
-            err_console.print(f"  [dim]{item.message}[/dim]")
-          else:
-            progress.update(
-              task,
-              description=f"Step {item.step}: {item.action} (${item.cost_so_far:.4f})",
-            )
-        else:
-          # NavigatorOutput - final result
-          result = item
-
-  return result
+  register_navigate(app)
 
 
 if __name__ == "__main__":
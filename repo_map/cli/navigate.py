@@ -0,0 +1,284 @@
+"""The `navigate` command, registered lazily by the main CLI app."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+from repo_map.cli._shared import err_console, get_logger, out_console
+
+if TYPE_CHECKING:
+  from structlog.typing import FilteringBoundLogger
+
+  from repo_map.navigator.runner import NavigatorOutput
+
+
+def register_navigate(app: typer.Typer) -> None:
+  """Attach the `navigate` command to the CLI app."""
+  app.command()(navigate)
+
+
+def navigate(
+  path: Annotated[
+    Path,
+    typer.Argument(
+      exists=True, file_okay=False, dir_okay=True, help="Root directory to explore"
+    ),
+  ] = Path("."),
+  goal: Annotated[
+    str,
+    typer.Option(
+      "--goal",
+      "-g",
+      help="Description of your task or what you're looking for.",
+    ),
+  ] = "",
+  tokens: Annotated[
+    int | None,
+    typer.Option("--tokens", "-t", help="Maximum token budget for context window."),
+  ] = None,
+  cost_limit: Annotated[
+    float | None,
+    typer.Option("--cost-limit", help="Maximum USD to spend on exploration."),
+  ] = None,
+  model: Annotated[
+    str | None,
+    typer.Option("--model", "-m", help="LLM model to use for navigation."),
+  ] = None,
+  max_iterations: Annotated[
+    int,
+    typer.Option("--max-iterations", help="Maximum exploration iterations."),
+  ] = 20,
+  output_file: Annotated[
+    Path | None,
+    typer.Option("--output", "-o", help="Write context output to a file."),
+  ] = None,
+  flight_plan: Annotated[
+    Path | None,
+    typer.Option("--flight-plan", "-f", help="Export flight plan to YAML."),
+  ] = None,
+  copy: Annotated[
+    bool,
+    typer.Option("--copy", "-c", help="Copy context output to clipboard."),
+  ] = False,
+  quiet: Annotated[
+    bool,
+    typer.Option("--quiet", "-q", help="Suppress progress output."),
+  ] = False,
+  debug: Annotated[
+    bool,
+    typer.Option("--debug", "-d", help="Enable verbose debug output."),
+  ] = False,
+):
+  """
+  Autonomously explore a repository to discover relevant context for your task.
+
+  The Navigator agent iteratively refines its view of the codebase, starting
+  with a broad overview and progressively focusing on areas relevant to your
+  goal. It produces an optimized context window within your token budget.
+
+  Example:
+      repo-map navigate . -g "understand the authentication flow"
+  """
+  import asyncio
+  import logging
+
+  from repo_map.logging_config import configure_adk_debug_logging, configure_logging
+  from repo_map.settings import Settings
+
+  log = get_logger()
+  settings = Settings()
+
+  # Configure API key for ADK (bridges GEMINI_API_KEY to GOOGLE_API_KEY)
+  settings.configure_api_key()
+
+  # Configure ADK debug logging if requested
+  debug_log_file = None
+  if debug:
+    # Debug events are filtered out by default
+    configure_logging(logging.DEBUG)
+    debug_log_file = configure_adk_debug_logging()
+    err_console().print(f"[dim]Debug logging enabled → {debug_log_file}[/dim]")
+
+  # Validate goal
+  if not goal:
+    err_console().print("[red]Error: --goal is required for navigation[/red]")
+    raise typer.Exit(code=2)
+
+  # Resolve settings with CLI overrides
+  effective_tokens = tokens or settings.navigator_default_token_budget
+  effective_cost_limit = cost_limit or settings.navigator_default_cost_limit_usd
+  effective_model = model or settings.navigator_model
+
+  # Run the async navigation
+  try:
+    result = asyncio.run(
+      _run_navigation(
+        path=path,
+        goal=goal,
+        tokens=effective_tokens,
+        cost_limit=effective_cost_limit,
+        model=effective_model,
+        max_iterations=max_iterations,
+        quiet=quiet,
+        debug=debug,
+        log=log,
+      )
+    )
+  except Exception as e:
+    log.error("navigation_failed", error=str(e))
+    err_console().print(f"[red]Navigation failed: {e}[/red]")
+    raise typer.Exit(code=1) from e
+
+  if result is None:
+    err_console().print("[yellow]Navigation produced no results.[/yellow]")
+    raise typer.Exit(code=1)
+
+  # Handle output
+  context_output = result.context_string
+
+  if copy:
+    from repo_map.clipboard import copy_to_clipboard
+
+    success = copy_to_clipboard(context_output.encode("utf-8"))
+    if success:
+      if not quiet:
+        err_console().print(
+          f"[bold green]✓ Copied context to clipboard[/bold green] "
+          f"({len(context_output)} chars, ~{result.token_count} tokens)"
+        )
+    else:
+      err_console().print("[red]✗ Clipboard copy failed. Printing to stdout:[/red]")
+      out_console().print(context_output)
+  elif output_file:
+    output_file.write_bytes(context_output.encode("utf-8"))
+    if not quiet:
+      err_console().print(f"[bold green]✓ Saved context to {output_file}[/bold green]")
+  else:
+    out_console().print(context_output)
+
+  # Export flight plan if requested
+  if flight_plan:
+    flight_plan.write_text(result.flight_plan_yaml, encoding="utf-8")
+    if not quiet:
+      err_console().print(
+        f"[bold green]✓ Saved flight plan: {flight_plan}[/bold green]"
+      )
+
+  # Print summary unless quiet
+  if not quiet:
+    err_console().print("\n[bold]Navigation Summary:[/bold]")
+    err_console().print(f"  Iterations: {result.total_iterations}")
+    err_console().print(f"  Total cost: ${result.total_cost:.4f}")
+    err_console().print(f"  Token count: ~{result.token_count}")
+    if result.reasoning_summary:
+      err_console().print(f"\n[dim]{result.reasoning_summary}[/dim]")
+    if debug_log_file:
+      err_console().print(f"\n[dim]Full ADK debug logs: {debug_log_file}[/dim]")
+
+
+async def _run_navigation(
+  path: Path,
+  goal: str,
+  tokens: int,
+  cost_limit: float,
+  model: str,
+  max_iterations: int,
+  quiet: bool,
+  debug: bool,
+  log: FilteringBoundLogger,
+) -> NavigatorOutput | None:
+  """Run the Navigator agent asynchronously."""
+  import contextlib
+  import uuid
+
+  from rich.progress import Progress, SpinnerColumn, TextColumn
+
+  from repo_map.navigator.runner import (
+    NavigatorOutput,
+    create_navigator_runner,
+    initialize_session,
+    run_autonomous,
+  )
+
+  # Generate session identifiers
+  user_id = "cli-user"
+  session_id = str(uuid.uuid4())
+
+  log.info(
+    "starting_navigation",
+    path=str(path),
+    goal=goal[:50],
+    tokens=tokens,
+    cost_limit=cost_limit,
+    model=model,
+    max_iterations=max_iterations,
+  )
+
+  # Create runner
+  runner, budget_plugin = create_navigator_runner(model=model)
+
+  # Initialize session
+  await initialize_session(
+    runner=runner,
+    user_id=user_id,
+    session_id=session_id,
+    repo_path=path,
+    user_task=goal,
+    token_budget=tokens,
+    cost_limit=cost_limit,
+    model=model,
+  )
+
+  result: NavigatorOutput | None = None
+  console = err_console()
+
+  # Rich's live progress (and its refresh thread) only pays off on an
+  # interactive terminal; debug output and pipes get plain lines instead
+  use_progress = not quiet and not debug and console.is_terminal
+  progress_display: contextlib.AbstractContextManager[Progress | None]
+  if use_progress:
+    progress_display = Progress(
+      SpinnerColumn(),
+      TextColumn("[progress.description]{task.description}"),
+      console=console,
+      transient=True,
+    )
+  else:
+    progress_display = contextlib.nullcontext()
+
+  with progress_display as progress:
+    task = None
+    if progress is not None:
+      task = progress.add_task("Exploring repository...", total=None)
+
+    async for item in run_autonomous(
+      runner,
+      budget_plugin,
+      user_id,
+      session_id,
+      max_iterations=max_iterations,
+      debug=debug,
+    ):
+      if isinstance(item, NavigatorOutput):
+        # Final result
+        result = item
+      elif quiet:
+        continue
+      elif debug:
+        # In debug mode, print detailed progress
+        console.print(
+          f"[cyan]Step {item.step}[/cyan]: {item.action} | "
+          f"tokens={item.tokens} | cost=${item.cost_so_far:.4f}"
+        )
+        console.print(f"  [dim]{item.message}[/dim]")
+      else:
+        description = f"Step {item.step}: {item.action} (${item.cost_so_far:.4f})"
+        if progress is not None and task is not None:
+          progress.update(task, description=description)
+        else:
+          console.print(description, markup=False, highlight=False)
+
+  return result
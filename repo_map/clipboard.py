@@ -1,52 +1,93 @@
 import base64
+import functools
 import os
 import shutil
 import subprocess
 import sys
 
+# Subprocess backends in priority order: (executable, argv)
+BACKENDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+  # WSL
+  ("clip.exe", ("clip.exe",)),
+  # X11
+  ("xclip", ("xclip", "-selection", "clipboard")),
+  # Wayland
+  ("wl-copy", ("wl-copy",)),
+)
 
-def copy_to_clipboard(text: str) -> bool:
+
+# Multiple of 3 so each encoded chunk carries no padding and chunks concatenate
+_OSC52_CHUNK = 57 * 1024
+
+
+@functools.cache
+def _which(tool: str) -> str | None:
+  """Resolve an executable on PATH once per process."""
+  return shutil.which(tool)
+
+
+def _write_osc52(data: bytes | memoryview) -> None:
+  """Stream data to the terminal clipboard as an OSC 52 escape sequence.
+
+  The payload is base64-encoded in chunks straight into the stdout buffer, so
+  no full-size encoded copy is ever built.
+  """
+  # Drain pending text first so it can't land inside the escape sequence
+  sys.stdout.flush()
+  out = sys.stdout.buffer
+  view = memoryview(data)
+  # \033]52;c;{base64}\a
+  out.write(b"\033]52;c;")
+  for i in range(0, len(view), _OSC52_CHUNK):
+    out.write(base64.b64encode(view[i : i + _OSC52_CHUNK]))
+  out.write(b"\a")
+  # Write directly to stdout (tty) ensuring it's not buffered
+  out.flush()
+
+
+def _pipe_to(argv: tuple[str, ...], data: bytes | memoryview) -> bool:
+  """Write data to a clipboard tool's stdin; True if the tool exits cleanly.
+
+  Writing to the pipe directly avoids the extra payload copy and reader
+  threads that ``subprocess.run(input=...)`` sets up.
+  """
+  proc = subprocess.Popen(
+    argv,
+    stdin=subprocess.PIPE,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+  )
+  try:
+    proc.stdin.write(data)
+    proc.stdin.close()
+  except BrokenPipeError:
+    # The tool exited early; its return code reports the failure
+    pass
+  return proc.wait() == 0
+
+
+def copy_to_clipboard(data: str | bytes | memoryview) -> bool:
   """
   Copies text to clipboard, supporting WSL, OSC 52 (VS Code), and Linux X11/Wayland.
+  Accepts a str or UTF-8 encoded bytes; bytes are passed through as is so callers
+  that already encoded their output don't pay for a second copy.
   Returns True if successful.
   """
-  data = text.encode("utf-8")
+  if isinstance(data, str):
+    data = data.encode("utf-8")
 
-  # 1. WSL Check
-  if shutil.which("clip.exe"):
+  # 1. OSC 52 (VS Code / Remote Containers) needs no subprocess, so try it first
+  # Checks specific env vars usually present in these environments, and only
+  # when stdout is a terminal so escape codes never leak into redirected output
+  in_vscode = (
+    os.environ.get("REMOTE_CONTAINERS") or os.environ.get("TERM_PROGRAM") == "vscode"
+  )
+  if in_vscode and sys.stdout.isatty():
     try:
-      subprocess.run(["clip.exe"], input=data, check=True)
-      return True
-    except subprocess.CalledProcessError:
-      pass
-
-  # 2. OSC 52 (VS Code / Remote Containers)
-  # Checks specific env vars usually present in these environments
-  if os.environ.get("REMOTE_CONTAINERS") or os.environ.get("TERM_PROGRAM") == "vscode":
-    try:
-      # \033]52;c;{base64}\a
-      encoded = base64.b64encode(data).decode("utf-8")
-      # Write directly to stdout (tty) ensuring it's not buffered
-      sys.stdout.write(f"\033]52;c;{encoded}\a")
-      sys.stdout.flush()
+      _write_osc52(data)
       return True
     except Exception:
       pass
 
-  # 3. X11 (xclip)
-  if shutil.which("xclip"):
-    try:
-      subprocess.run(["xclip", "-selection", "clipboard"], input=data, check=True)
-      return True
-    except subprocess.CalledProcessError:
-      pass
-
-  # 4. Wayland (wl-copy)
-  if shutil.which("wl-copy"):
-    try:
-      subprocess.run(["wl-copy"], input=data, check=True)
-      return True
-    except subprocess.CalledProcessError:
-      pass
-
-  return False
+  # 2. Clipboard tools (WSL, X11, Wayland)
+  return any(_which(tool) and _pipe_to(argv, data) for tool, argv in BACKENDS)
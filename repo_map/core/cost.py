@@ -6,12 +6,33 @@ verbosity levels.
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from repo_map.core.verbosity import VerbosityLevel
 
 if TYPE_CHECKING:
-  from collections.abc import Mapping
+  from collections.abc import Iterable
+
+  import numpy.typing as npt
+
+# Per-level costs indexed by int(VerbosityLevel)
+CostRow = Sequence[int]
+
+
+def costs_row(costs: Mapping[VerbosityLevel, int]) -> tuple[int, ...]:
+  """Flatten a level-keyed cost dict into a row indexed by level.
+
+  Args:
+      costs: Dict of verbosity level to token cost; missing levels count as 0
+
+  Returns:
+      Tuple of costs where index i holds the cost at VerbosityLevel(i)
+  """
+  return tuple(costs.get(level, 0) for level in VerbosityLevel)
 
 
 def estimate_tokens(text: str) -> int:
@@ -29,6 +50,84 @@ def estimate_tokens(text: str) -> int:
   return len(text) // 4
 
 
+def estimate_tokens_batch(texts: Iterable[str]) -> list[int]:
+  """Estimate token counts for several texts in one pass.
+
+  Args:
+      texts: Text contents to estimate tokens for
+
+  Returns:
+      Estimated token count for each text, in input order
+  """
+  return [len(text) // 4 for text in texts]
+
+
+def cost_at(
+  level: VerbosityLevel,
+  content: str,
+  structure_content: str | None = None,
+  interface_content: str | None = None,
+) -> int:
+  """Calculate the token cost of a file at a single verbosity level.
+
+  Only the text needed for ``level`` is measured, so callers rendering at one
+  level avoid estimating the others.
+
+  Args:
+      level: Verbosity level to calculate for
+      content: Full file content (Level 4)
+      structure_content: Structure-only content (Level 2), optional
+      interface_content: Interface content (Level 3), optional
+
+  Returns:
+      Token cost at the given level
+  """
+  match level:
+    case VerbosityLevel.EXCLUDE:
+      # Level 0: Exclude (nothing rendered)
+      return 0
+    case VerbosityLevel.EXISTENCE:
+      # Level 1: Existence (path only)
+      # Approximate: "path/to/file.py\n" is small, estimate ~5 tokens
+      return 5
+    case VerbosityLevel.STRUCTURE:
+      # Level 2: Structure (definitions only)
+      # If not provided, estimate as ~15% of full content
+      if structure_content is not None:
+        return estimate_tokens(structure_content)
+      return int(estimate_tokens(content) * 0.15)
+    case VerbosityLevel.INTERFACE:
+      # Level 3: Interface (signatures + docstrings)
+      # If not provided, estimate as ~40% of full content
+      if interface_content is not None:
+        return estimate_tokens(interface_content)
+      return int(estimate_tokens(content) * 0.4)
+    case VerbosityLevel.IMPLEMENTATION:
+      # Level 4: Full content
+      return estimate_tokens(content)
+
+
+def calculate_file_cost_row(
+  content: str,
+  structure_content: str | None = None,
+  interface_content: str | None = None,
+) -> tuple[int, ...]:
+  """Calculate token costs for a file at all levels as a level-indexed row.
+
+  Args:
+      content: Full file content (Level 4)
+      structure_content: Structure-only content (Level 2), optional
+      interface_content: Interface content (Level 3), optional
+
+  Returns:
+      Tuple of costs where index i holds the cost at VerbosityLevel(i)
+  """
+  return tuple(
+    cost_at(level, content, structure_content, interface_content)
+    for level in VerbosityLevel
+  )
+
+
 def calculate_file_costs(
   content: str,
   structure_content: str | None = None,
@@ -36,6 +135,9 @@ def calculate_file_costs(
 ) -> dict[VerbosityLevel, int]:
   """Calculate token costs for a file at all verbosity levels.
 
+  Prefer :func:`cost_at` when only one level is needed, and
+  :func:`calculate_file_cost_row` for int-indexed consumers.
+
   Args:
       content: Full file content (Level 4)
       structure_content: Structure-only content (Level 2), optional
@@ -44,59 +146,26 @@ def calculate_file_costs(
   Returns:
       Dict mapping VerbosityLevel to token cost
   """
-  # Level 4: Full content
-  l4_tokens = estimate_tokens(content)
-
-  # Level 3: Interface (signatures + docstrings)
-  # If not provided, estimate as ~40% of full content
-  if interface_content is not None:
-    l3_tokens = estimate_tokens(interface_content)
-  else:
-    l3_tokens = int(l4_tokens * 0.4)
-
-  # Level 2: Structure (definitions only)
-  # If not provided, estimate as ~15% of full content
-  if structure_content is not None:
-    l2_tokens = estimate_tokens(structure_content)
-  else:
-    l2_tokens = int(l4_tokens * 0.15)
-
-  # Level 1: Existence (path only)
-  # Approximate: "path/to/file.py\n" is small, estimate ~5 tokens
-  l1_tokens = 5
-
-  # Level 0: Exclude (nothing rendered)
-  l0_tokens = 0
-
-  return {
-    VerbosityLevel.EXCLUDE: l0_tokens,
-    VerbosityLevel.EXISTENCE: l1_tokens,
-    VerbosityLevel.STRUCTURE: l2_tokens,
-    VerbosityLevel.INTERFACE: l3_tokens,
-    VerbosityLevel.IMPLEMENTATION: l4_tokens,
-  }
+  row = calculate_file_cost_row(content, structure_content, interface_content)
+  return dict(zip(VerbosityLevel, row, strict=True))
 
 
 def format_cost_annotation(
   path: str,
-  costs: Mapping[VerbosityLevel, int],
+  costs: Mapping[VerbosityLevel, int] | CostRow,
 ) -> str:
   """Format cost annotation for a file header.
 
   Args:
       path: File path
-      costs: Dict of verbosity level to token cost
+      costs: Dict of verbosity level to token cost, or a row indexed by level
 
   Returns:
       Formatted annotation string like:
       "# path/file.py [L1:5 L2:50 L3:120 L4:340]"
   """
-  l1 = costs.get(VerbosityLevel.EXISTENCE, 0)
-  l2 = costs.get(VerbosityLevel.STRUCTURE, 0)
-  l3 = costs.get(VerbosityLevel.INTERFACE, 0)
-  l4 = costs.get(VerbosityLevel.IMPLEMENTATION, 0)
-
-  return f"# {path} [L1:{l1} L2:{l2} L3:{l3} L4:{l4}]"
+  c = costs_row(costs) if isinstance(costs, Mapping) else costs
+  return f"# {path} [L1:{c[1]} L2:{c[2]} L3:{c[3]} L4:{c[4]}]"
 
 
 def format_budget_warning(budget: int, actual: int) -> str:
@@ -114,7 +183,13 @@ def format_budget_warning(budget: int, actual: int) -> str:
 
 
 class CostManifest:
-  """Tracks costs across multiple files for budget management."""
+  """Tracks costs across multiple files for budget management.
+
+  Costs are stored as plain int rows indexed by level (one per file) and
+  stacked into a NumPy matrix on demand, so per-level totals run as
+  vectorized reductions. Each file's
+  largest cost is tracked as it is added, for ranking contributors.
+  """
 
   def __init__(self, budget: int):
     """Initialize cost manifest.
@@ -123,24 +198,56 @@ class CostManifest:
         budget: Token budget limit
     """
     self.budget = budget
-    self.files: dict[str, dict[VerbosityLevel, int]] = {}
+    self._paths: list[str] = []
+    self._rows: list[tuple[int, ...]] = []
+    self._max_costs: list[int] = []
+    self._index: dict[str, int] = {}
+    self._array: npt.NDArray[np.int64] | None = None
     self._actual: int = 0
 
   def add_file(
     self,
     path: str,
-    costs: dict[VerbosityLevel, int],
+    costs: Mapping[VerbosityLevel, int] | CostRow,
     rendered_level: VerbosityLevel,
   ) -> None:
     """Add a file's costs to the manifest.
 
     Args:
         path: Relative file path
-        costs: Token costs at each verbosity level
+        costs: Token costs at each verbosity level, as a dict or a row indexed
+            by level
         rendered_level: The level at which this file was rendered
     """
-    self.files[path] = costs
-    self._actual += costs.get(rendered_level, 0)
+    row = costs_row(costs) if isinstance(costs, Mapping) else tuple(costs)
+    existing = self._index.get(path)
+    if existing is None:
+      self._index[path] = len(self._paths)
+      self._paths.append(path)
+      self._rows.append(row)
+      self._max_costs.append(max(row))
+    else:
+      self._rows[existing] = row
+      self._max_costs[existing] = max(row)
+    self._array = None
+    self._actual += row[rendered_level]
+
+  @property
+  def _costs(self) -> npt.NDArray[np.int64]:
+    """Cost matrix of shape (n_files, n_levels), built lazily."""
+    if self._array is None:
+      self._array = np.asarray(self._rows, dtype=np.int64).reshape(
+        -1, len(VerbosityLevel)
+      )
+    return self._array
+
+  @property
+  def files(self) -> dict[str, dict[VerbosityLevel, int]]:
+    """Per-file costs keyed by path, built on demand."""
+    return {
+      path: dict(zip(VerbosityLevel, row, strict=True))
+      for path, row in zip(self._paths, self._rows, strict=True)
+    }
 
   @property
   def actual(self) -> int:
@@ -166,7 +273,7 @@ class CostManifest:
     Returns:
         Total token count
     """
-    return sum(costs.get(level, 0) for costs in self.files.values())
+    return int(self._costs[:, int(level)].sum())
 
   def get_top_contributors(self, n: int = 5) -> list[tuple[str, int]]:
     """Get the files contributing most to the actual token count.
@@ -177,10 +284,7 @@ class CostManifest:
     Returns:
         List of (path, tokens) tuples, sorted by tokens descending
     """
-    contributors: list[tuple[str, int]] = []
-    for path, costs in self.files.items():
-      # Use the max cost as a proxy (actual rendered level tracked separately)
-      max_cost = max(costs.values())
-      contributors.append((path, max_cost))
-
-    return sorted(contributors, key=lambda x: x[1], reverse=True)[:n]
+    # Use the max cost as a proxy (actual rendered level tracked separately)
+    max_costs = self._max_costs
+    top = heapq.nlargest(n, range(len(max_costs)), key=max_costs.__getitem__)
+    return [(self._paths[i], max_costs[i]) for i in top]
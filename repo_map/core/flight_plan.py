@@ -7,19 +7,49 @@ rendering.
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 from repo_map.core.verbosity import VerbosityLevel
 
+if TYPE_CHECKING:
+  from collections.abc import Sequence
+
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Validators are built on first use rather than at import, so commands that
+# never load a flight plan don't pay for schema construction
+_MODEL_CONFIG = ConfigDict(extra="forbid", defer_build=True)
+
+
+@functools.lru_cache(maxsize=1024)
+def _glob_regex(pattern: str) -> re.Pattern[str]:
+  """Compile an fnmatch-style glob once per process.
+
+  Verbosity rules are matched against every file in the repository, so the
+  translated regex is reused instead of going through ``fnmatch`` each time.
+  """
+  return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _glob_match(rel_path: str, pattern: str) -> bool:
+  """Equivalent of ``fnmatch.fnmatch`` backed by the compiled-pattern cache."""
+  return _glob_regex(pattern).match(os.path.normcase(rel_path)) is not None
+
 
 class PathBoost(BaseModel):
   """A file/directory path pattern with boost weight for PageRank."""
 
-  model_config = ConfigDict(extra="forbid")
+  model_config = _MODEL_CONFIG
 
   pattern: Annotated[str, Field(min_length=1, description="Glob pattern for paths")]
   weight: Annotated[
@@ -30,7 +60,7 @@ class PathBoost(BaseModel):
 class SymbolBoost(BaseModel):
   """A symbol name with boost weight for PageRank."""
 
-  model_config = ConfigDict(extra="forbid")
+  model_config = _MODEL_CONFIG
 
   name: Annotated[str, Field(min_length=1, description="Symbol name to boost")]
   weight: Annotated[
@@ -41,7 +71,7 @@ class SymbolBoost(BaseModel):
 class Focus(BaseModel):
   """Configuration for symbol/path boosting in PageRank."""
 
-  model_config = ConfigDict(extra="forbid")
+  model_config = _MODEL_CONFIG
 
   paths: list[PathBoost] = Field(
     default_factory=list, description="File/directory patterns to boost"
@@ -54,7 +84,7 @@ class Focus(BaseModel):
 class SectionVerbosity(BaseModel):
   """Verbosity rule for a section within a file."""
 
-  model_config = ConfigDict(extra="forbid")
+  model_config = _MODEL_CONFIG
 
   pattern: Annotated[
     str, Field(min_length=1, description="Glob pattern for section names")
@@ -73,7 +103,7 @@ class VerbosityRule(BaseModel):
   Either `level` or `sections` must be specified, but not both.
   """
 
-  model_config = ConfigDict(extra="forbid")
+  model_config = _MODEL_CONFIG
 
   pattern: Annotated[str, Field(min_length=1, description="Glob pattern")]
   level: Annotated[int | None, Field(default=None, ge=0, le=4)] = None
@@ -99,7 +129,7 @@ class VerbosityRule(BaseModel):
 class CustomQuery(BaseModel):
   """Custom tree-sitter query for specific paths."""
 
-  model_config = ConfigDict(extra="forbid")
+  model_config = _MODEL_CONFIG
 
   pattern: Annotated[str, Field(min_length=1, description="Glob pattern")]
   query: Annotated[str, Field(min_length=1, description="Tree-sitter .scm query")]
@@ -115,7 +145,7 @@ class FlightPlan(BaseModel):
   - Custom tree-sitter queries
   """
 
-  model_config = ConfigDict(extra="forbid")
+  model_config = _MODEL_CONFIG
 
   budget: Annotated[int, Field(default=20000, gt=0, description="Token budget limit")]
   focus: Focus | None = None
@@ -140,14 +170,14 @@ class FlightPlan(BaseModel):
         ValueError: If YAML is invalid or doesn't match schema
     """
     try:
-      data = yaml.safe_load(yaml_content)
+      data = yaml.load(yaml_content, Loader=_SafeLoader)
     except yaml.YAMLError as e:
       raise ValueError(f"Invalid YAML syntax: {e}") from e
 
     if data is None:
       data = {}
 
-    return cls.model_validate(data)
+    return _flight_plan_adapter().validate_python(data)
 
   @classmethod
   def from_yaml_file(cls, path: Path | str) -> FlightPlan:
@@ -163,35 +193,92 @@ class FlightPlan(BaseModel):
         FileNotFoundError: If file doesn't exist
         ValueError: If YAML is invalid or doesn't match schema
     """
-    path = Path(path)
-    if not path.exists():
-      raise FileNotFoundError(f"Flight plan not found: {path}")
+    path = Path(path).resolve()
+    try:
+      mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+      raise FileNotFoundError(f"Flight plan not found: {path}") from None
 
-    yaml_content = path.read_text(encoding="utf-8")
-    return cls.from_yaml(yaml_content)
+    # Hand out a copy so callers can't mutate the cached instance
+    return _load_flight_plan_cached(str(path), mtime_ns).model_copy(deep=True)
 
-  def get_verbosity_for_path(self, rel_path: str) -> VerbosityLevel:
-    """Get the verbosity level for a file path.
+  def resolve_path(
+    self, rel_path: str
+  ) -> tuple[VerbosityLevel, list[SectionVerbosity] | None]:
+    """Resolve the file-level verbosity and section rules for a path.
 
-    Applies verbosity rules in order, last match wins.
+    Applies verbosity rules in order in a single pass, last match wins for
+    both the level and the section rules.
 
     Args:
         rel_path: Relative path to match
 
     Returns:
-        VerbosityLevel for the path (IMPLEMENTATION if no rule matches)
+        Tuple of (verbosity_level, section_rules). The level is IMPLEMENTATION
+        if no level rule matches; section rules are None if none apply.
     """
-    import fnmatch
+    if not self.verbosity:
+      # Common default config: nothing to match
+      return VerbosityLevel.IMPLEMENTATION, None
 
     level = VerbosityLevel.IMPLEMENTATION  # Default to full content
+    sections: list[SectionVerbosity] | None = None
 
     for rule in self.verbosity:
-      if fnmatch.fnmatch(rel_path, rule.pattern) and rule.level is not None:
+      if not _glob_match(rel_path, rule.pattern):
+        continue
+      # A rule sets either a file-level level or section rules, never both
+      if rule.level is not None:
         level = VerbosityLevel(rule.level)
-      # If sections are specified, file-level is IMPLEMENTATION
-      # Section-level verbosity is handled separately
+      else:
+        sections = rule.sections
+
+    return level, sections
+
+  def resolve_paths(
+    self, rel_paths: Sequence[str]
+  ) -> list[tuple[VerbosityLevel, list[SectionVerbosity] | None]]:
+    """Resolve verbosity and section rules for many paths at once.
+
+    Equivalent to calling :meth:`resolve_path` for each path, but the rules
+    form the outer loop so each compiled pattern sweeps the whole batch.
+
+    Args:
+        rel_paths: Relative paths to match
 
-    return level
+    Returns:
+        One (verbosity_level, section_rules) tuple per path, in input order
+    """
+    if not self.verbosity:
+      return [(VerbosityLevel.IMPLEMENTATION, None)] * len(rel_paths)
+
+    levels = [VerbosityLevel.IMPLEMENTATION] * len(rel_paths)
+    sections: list[list[SectionVerbosity] | None] = [None] * len(rel_paths)
+    normalized = [os.path.normcase(p) for p in rel_paths]
+    for rule in self.verbosity:
+      match = _glob_regex(rule.pattern).match
+      matched = [i for i, path in enumerate(normalized) if match(path)]
+      if rule.level is not None:
+        level = VerbosityLevel(rule.level)
+        for i in matched:
+          levels[i] = level
+      else:
+        for i in matched:
+          sections[i] = rule.sections
+    return list(zip(levels, sections, strict=True))
+
+  def get_verbosity_for_path(self, rel_path: str) -> VerbosityLevel:
+    """Get the verbosity level for a file path.
+
+    Applies verbosity rules in order, last match wins.
+
+    Args:
+        rel_path: Relative path to match
+
+    Returns:
+        VerbosityLevel for the path (IMPLEMENTATION if no rule matches)
+    """
+    return self.resolve_path(rel_path)[0]
 
   def get_section_rules_for_path(self, rel_path: str) -> list[SectionVerbosity] | None:
     """Get section-level verbosity rules for a file path.
@@ -202,13 +289,7 @@ class FlightPlan(BaseModel):
     Returns:
         List of section rules if any apply, None otherwise
     """
-    import fnmatch
-
-    for rule in self.verbosity:
-      if fnmatch.fnmatch(rel_path, rule.pattern) and rule.sections is not None:
-        return rule.sections
-
-    return None
+    return self.resolve_path(rel_path)[1]
 
   def to_yaml(self) -> str:
     """Serialize the flight plan to YAML string.
@@ -217,7 +298,30 @@ class FlightPlan(BaseModel):
         YAML representation of the flight plan
     """
     data = self.model_dump(exclude_none=True, exclude_defaults=True)
-    return yaml.safe_dump(data, default_flow_style=False, sort_keys=False)
+    return yaml.dump(
+      data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+    )
+
+
+@functools.cache
+def _flight_plan_adapter() -> TypeAdapter[FlightPlan]:
+  """Validator for flight plan data, built on first use like the models."""
+  return TypeAdapter(FlightPlan)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_flight_plan_cached(path: str, mtime_ns: int) -> FlightPlan:
+  """Parse a flight plan file, memoized on its path and modification time.
+
+  Args:
+      path: Resolved path to the YAML file
+      mtime_ns: File modification time, so edits invalidate the cache entry
+
+  Returns:
+      Validated FlightPlan instance
+  """
+  del mtime_ns  # Only part of the cache key
+  return FlightPlan.from_yaml(Path(path).read_text(encoding="utf-8"))
 
 
 def load_flight_plan(path: Path | str | None) -> FlightPlan | None:
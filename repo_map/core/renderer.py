@@ -6,23 +6,36 @@ Renders files at different verbosity levels based on FlightPlan rules.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pathspec import PathSpec
 from pathspec.patterns import GitWildMatchPattern
 
-from repo_map.core.cost import CostManifest, estimate_tokens
+from repo_map.core.cost import (
+  CostManifest,
+  estimate_tokens,
+  estimate_tokens_batch,
+)
+from repo_map.core.tags import filename_to_lang, get_tags_from_code, parse_code
 from repo_map.core.verbosity import VerbosityLevel
 
 if TYPE_CHECKING:
+  from collections.abc import Iterable
+
   from repo_map.core.flight_plan import (
     FlightPlan,
     SectionVerbosity,
     VerbosityRule,
   )
+  from repo_map.core.tags import Tag
+
+  # (file_path, content, tree-sitter tree, tags by level) of one parsed file
+  _ParseEntry = tuple[str, str, Any, dict[VerbosityLevel, list[Tag]]]
 
 
 @dataclass
@@ -72,6 +85,44 @@ class ContextRenderer:
     self.cost_manifest = CostManifest(
       budget=flight_plan.budget if flight_plan else 20000
     )
+    # Parse of the most recently tagged file. Only that file's levels reuse
+    # it, so earlier files' trees are not kept alive.
+    self._last_parse: _ParseEntry | None = None
+
+  def resolve_path(
+    self, file_path: str
+  ) -> tuple[VerbosityLevel, list[SectionVerbosity] | None]:
+    """
+    Get the verbosity level and section rules for a file path.
+
+    Matches the path against FlightPlan verbosity rules in a single pass
+    (last match wins).
+
+    Args:
+        file_path: Relative path to the file
+
+    Returns:
+        Tuple of (verbosity_level, section_rules)
+    """
+    if self.flight_plan:
+      return self.flight_plan.resolve_path(file_path)
+    return self.default_verbosity, None
+
+  def resolve_paths(
+    self, file_paths: Sequence[str]
+  ) -> list[tuple[VerbosityLevel, list[SectionVerbosity] | None]]:
+    """
+    Get the verbosity level and section rules for many file paths at once.
+
+    Args:
+        file_paths: Relative paths to the files
+
+    Returns:
+        One (verbosity_level, section_rules) tuple per path, in input order
+    """
+    if self.flight_plan:
+      return self.flight_plan.resolve_paths(file_paths)
+    return [(self.default_verbosity, None)] * len(file_paths)
 
   def get_verbosity_for_path(self, file_path: str) -> VerbosityLevel:
     """
@@ -85,9 +136,7 @@ class ContextRenderer:
     Returns:
         Verbosity level for the file
     """
-    if self.flight_plan:
-      return self.flight_plan.get_verbosity_for_path(file_path)
-    return self.default_verbosity
+    return self.resolve_path(file_path)[0]
 
   def get_section_verbosity(
     self,
@@ -164,18 +213,13 @@ class ContextRenderer:
     Returns:
         Rendered content with definitions extracted
     """
-    from grep_ast import filename_to_lang  # type: ignore[reportMissingTypeStubs]
-
-    from repo_map.core.tags import get_tags_from_code
-
     lang = filename_to_lang(file_path)
     if not lang:
       # No parser available, fall back to full content for unknown languages
       return content
 
     # Get tags at the specified verbosity level
-    rel_fname = Path(file_path).name
-    tags = list(get_tags_from_code(file_path, rel_fname, content, verbosity))
+    tags = self._get_tags(file_path, content, verbosity)
 
     if not tags:
       # No tags extracted, return empty for structure/interface
@@ -196,58 +240,128 @@ class ContextRenderer:
 
     return "\n".join(output_lines)
 
-  def calculate_file_costs(
+  def _get_tags(
     self,
     file_path: str,
     content: str,
-  ) -> dict[VerbosityLevel, int]:
+    verbosity: VerbosityLevel,
+  ) -> list[Tag]:
     """
-    Calculate token costs for a file at all verbosity levels.
+    Get tags for a file at a verbosity level, reusing earlier work.
+
+    The file is parsed once and the tree shared by the per-level queries, so
+    rendering at STRUCTURE and INTERFACE costs a single tree-sitter parse.
 
     Args:
         file_path: Path to the file
         content: Full file content
+        verbosity: Verbosity level selecting the query
 
     Returns:
-        Dictionary mapping verbosity levels to token costs
+        Tags extracted at the given verbosity level
     """
-    costs: dict[VerbosityLevel, int] = {}
-
-    # Level 0: EXCLUDE - 0 tokens
-    costs[VerbosityLevel.EXCLUDE] = 0
+    entry = self._last_parse
+    if entry is None or entry[0] != file_path or entry[1] != content:
+      entry = (file_path, content, parse_code(file_path, content), {})
+      self._last_parse = entry
+
+    _, _, tree, tags_by_level = entry
+    tags = tags_by_level.get(verbosity)
+    if tags is None:
+      rel_fname = Path(file_path).name
+      tags = list(
+        get_tags_from_code(file_path, rel_fname, content, verbosity, tree=tree)
+      )
+      tags_by_level[verbosity] = tags
+    return tags
+
+  def render_all_levels(
+    self,
+    file_path: str,
+    content: str,
+  ) -> tuple[str, ...]:
+    """
+    Render file content at every verbosity level.
 
-    # Level 1: EXISTENCE - just the path
-    rel_path = Path(file_path).name
-    costs[VerbosityLevel.EXISTENCE] = estimate_tokens(rel_path)
+    Args:
+        file_path: Path to the file (for language detection)
+        content: Full file content
 
-    # Level 2: STRUCTURE
-    structure_content = self.render_file_at_level(
-      file_path, content, VerbosityLevel.STRUCTURE
+    Returns:
+        Tuple of rendered content where index i holds VerbosityLevel(i)
+    """
+    return tuple(
+      self.render_file_at_level(file_path, content, level) for level in VerbosityLevel
     )
-    costs[VerbosityLevel.STRUCTURE] = estimate_tokens(structure_content)
 
-    # Level 3: INTERFACE
-    interface_content = self.render_file_at_level(
-      file_path, content, VerbosityLevel.INTERFACE
+  def calculate_file_cost_row(
+    self,
+    file_path: str,
+    content: str,
+    renders: tuple[str, ...] | None = None,
+  ) -> tuple[int, ...]:
+    """
+    Calculate token costs for a file at all levels as a level-indexed row.
+
+    Args:
+        file_path: Path to the file
+        content: Full file content
+        renders: Output of :meth:`render_all_levels` for the same content,
+            if the caller already has it
+
+    Returns:
+        Tuple of costs where index i holds the cost at VerbosityLevel(i)
+    """
+    if renders is None:
+      renders = self.render_all_levels(file_path, content)
+
+    # Level 1 is just the path; count every level in one batch
+    rel_path = Path(file_path).name
+    l1, l2, l3, l4 = estimate_tokens_batch(
+      (
+        rel_path,
+        renders[VerbosityLevel.STRUCTURE],
+        renders[VerbosityLevel.INTERFACE],
+        content,
+      )
     )
-    costs[VerbosityLevel.INTERFACE] = estimate_tokens(interface_content)
 
-    # Level 4: IMPLEMENTATION
-    costs[VerbosityLevel.IMPLEMENTATION] = estimate_tokens(content)
+    # Level 0: EXCLUDE - 0 tokens
+    return (0, l1, l2, l3, l4)
+
+  def calculate_file_costs(
+    self,
+    file_path: str,
+    content: str,
+  ) -> dict[VerbosityLevel, int]:
+    """
+    Calculate token costs for a file at all verbosity levels.
+
+    Args:
+        file_path: Path to the file
+        content: Full file content
 
-    return costs
+    Returns:
+        Dictionary mapping verbosity levels to token costs
+    """
+    row = self.calculate_file_cost_row(file_path, content)
+    return dict(zip(VerbosityLevel, row, strict=True))
 
   def render(
     self,
-    files: list[tuple[str, str]],
+    files: Iterable[tuple[str, str | bytes]],
     show_costs: bool = False,
     strict: bool = False,
   ) -> str:
     """
     Render multiple files according to FlightPlan rules.
 
+    Files are consumed one at a time, so a generator can read each file on
+    demand instead of every content being loaded up front. Content may also be
+    raw UTF-8 bytes, which are only decoded if the file's level needs the text.
+
     Args:
-        files: List of (file_path, content) tuples
+        files: (file_path, content) tuples, as a sequence or any iterable
         show_costs: Whether to include cost annotations
         strict: Whether to enforce budget strictly (raise error if exceeded)
 
@@ -261,17 +375,43 @@ class ContextRenderer:
     total_tokens = 0
     budget = self.flight_plan.budget if self.flight_plan else 20000
 
-    for file_path, content in files:
-      verbosity = self.get_verbosity_for_path(file_path)
+    items: Iterable[tuple[tuple[str, str | bytes], VerbosityLevel]]
+    if isinstance(files, Sequence):
+      # Resolve every file's verbosity up front in one sweep per rule
+      resolved = self.resolve_paths([file_path for file_path, _ in files])
+      items = zip(files, (level for level, _ in resolved), strict=True)
+    else:
+      # Streamed input is resolved as each file arrives
+      items = ((file, self.get_verbosity_for_path(file[0])) for file in files)
 
+    for (file_path, content), verbosity in items:
       if verbosity == VerbosityLevel.EXCLUDE:
         continue
 
-      # Render at appropriate level
-      rendered = self.render_file_at_level(file_path, content, verbosity)
+      if isinstance(content, bytes):
+        # A path-only entry without cost annotations never looks at the text
+        if verbosity == VerbosityLevel.EXISTENCE and not show_costs:
+          content = ""
+        else:
+          content = _decode_text(content)
 
-      # Calculate cost
-      tokens = estimate_tokens(rendered) if rendered else estimate_tokens(file_path)
+      # Render at appropriate level; cost annotations need every level, so
+      # render them once and pick this file's level from the same results
+      cost_row: tuple[int, ...] | None = None
+      if show_costs:
+        renders = self.render_all_levels(file_path, content)
+        rendered = renders[verbosity]
+        cost_row = self.calculate_file_cost_row(file_path, content, renders)
+      else:
+        rendered = self.render_file_at_level(file_path, content, verbosity)
+
+      # Calculate cost, reusing the estimate already in the cost row
+      if not rendered:
+        tokens = estimate_tokens(file_path)
+      elif cost_row is not None:
+        tokens = cost_row[verbosity]
+      else:
+        tokens = estimate_tokens(rendered)
 
       # Check budget in strict mode
       if strict and total_tokens + tokens > budget:
@@ -284,24 +424,20 @@ class ContextRenderer:
       total_tokens += tokens
 
       # Build output for this file
-      file_output = f"## {file_path}\n"
+      file_output = [f"## {file_path}\n"]
 
-      if show_costs:
-        costs = self.calculate_file_costs(file_path, content)
-        file_output += (
-          f"# Costs: L0={costs[VerbosityLevel.EXCLUDE]}, "
-          f"L1={costs[VerbosityLevel.EXISTENCE]}, "
-          f"L2={costs[VerbosityLevel.STRUCTURE]}, "
-          f"L3={costs[VerbosityLevel.INTERFACE]}, "
-          f"L4={costs[VerbosityLevel.IMPLEMENTATION]} tokens\n"
+      if cost_row is not None:
+        c = cost_row
+        file_output.append(
+          f"# Costs: L0={c[0]}, L1={c[1]}, L2={c[2]}, L3={c[3]}, L4={c[4]} tokens\n"
         )
 
       if verbosity == VerbosityLevel.EXISTENCE:
-        file_output += f"# [path only - {tokens} tokens]\n"
+        file_output.append(f"# [path only - {tokens} tokens]\n")
       elif rendered:
-        file_output += f"```\n{rendered}\n```\n"
+        file_output += ("```\n", rendered, "\n```\n")
 
-      output_parts.append(file_output)
+      output_parts.append("".join(file_output))
 
     # Add budget summary
     summary = f"\n# Total: {total_tokens}/{budget} tokens"
@@ -312,6 +448,20 @@ class ContextRenderer:
     return "\n".join(output_parts)
 
 
+def _decode_text(data: bytes) -> str:
+  """Decode file bytes as a text-mode read would, translating newlines."""
+  text = data.decode("utf-8", errors="replace")
+  if "\r" in text:
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+  return text
+
+
+@functools.lru_cache(maxsize=1024)
+def _rule_spec(pattern: str) -> PathSpec:
+  """Build the gitwildmatch spec for a rule pattern once per process."""
+  return PathSpec.from_lines(GitWildMatchPattern, [pattern])
+
+
 def match_verbosity_rules(
   file_path: str,
   rules: list[VerbosityRule],
@@ -334,8 +484,7 @@ def match_verbosity_rules(
   sections: list[SectionVerbosity] | None = None
 
   for rule in rules:
-    spec = PathSpec.from_lines(GitWildMatchPattern, [rule.pattern])
-    if spec.match_file(file_path):
+    if _rule_spec(rule.pattern).match_file(file_path):
       if rule.verbosity_level is not None:
         level = rule.verbosity_level
       if rule.sections is not None:
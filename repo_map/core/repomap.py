@@ -10,21 +10,172 @@ This module generates a concise "map" of a code repository by:
 
 from __future__ import annotations
 
+import itertools
 import math
+import multiprocessing
 import os
+import re
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import networkx as nx  # type: ignore[reportMissingTypeStubs]
-from grep_ast import TreeContext  # type: ignore[reportMissingTypeStubs]
+import numpy as np
+import scipy.sparse  # type: ignore[reportMissingTypeStubs]
 from tqdm import tqdm
 
 from repo_map.core.special import filter_important_files
-from repo_map.core.tags import Tag, get_tags_from_code
+from repo_map.core.tags import (
+  Tag,
+  get_tags_cached,
+  get_tags_from_code,
+  prune_tags_cache,
+)
 
 if TYPE_CHECKING:
-  from collections.abc import Callable
+  from collections.abc import Callable, Iterable, Iterator
+
+  import numpy.typing as npt
+
+# Any Unicode letter, matching str.isalpha()
+_LETTER = re.compile(r"[^\W\d_]")
+
+# Below this many files, worker start-up costs more than parallel parsing saves
+_PARALLEL_MIN_FILES = 64
+
+
+def _read_tags(
+  fname: str, rel_fname: str, cache_dir: Path | None
+) -> tuple[list[Tag], str]:
+  """
+  Read a file and extract its tags.
+
+  Module-level so it can run in a worker process.
+
+  Args:
+      fname: Absolute path to the file
+      rel_fname: Relative path to the file (for display)
+      cache_dir: Directory of the persistent tag cache, or None to skip it
+
+  Returns:
+      Tuple of (tags, code): the tags found in the file and its text, both
+      empty if it can't be read
+  """
+  try:
+    with open(fname, encoding="utf-8", errors="ignore") as f:
+      code = f.read()
+  except OSError:
+    return [], ""
+  if not code:
+    return [], code
+
+  if cache_dir is None:
+    return list(get_tags_from_code(fname, rel_fname, code)), code
+  return get_tags_cached(fname, rel_fname, code, cache_dir), code
+
+
+def _pagerank(
+  n: int,
+  src: npt.NDArray[np.intp],
+  dst: npt.NDArray[np.intp],
+  weights: npt.NDArray[np.float64],
+  alpha: float = 0.85,
+  max_iter: int = 100,
+  tol: float = 1.0e-6,
+) -> npt.NDArray[np.float64]:
+  """
+  Compute weighted PageRank by power iteration over a sparse matrix.
+
+  Matches ``networkx.pagerank`` defaults: parallel edges are summed, rank held
+  by dangling nodes is spread uniformly, and iteration stops once the L1 change
+  drops below ``n * tol``.
+
+  Args:
+      n: Number of nodes
+      src: Source node index of each edge
+      dst: Destination node index of each edge
+      weights: Weight of each edge
+      alpha: Damping factor
+      max_iter: Maximum number of iterations
+      tol: Per-node convergence tolerance
+
+  Returns:
+      Rank of each node, summing to 1
+  """
+  # Duplicate (src, dst) entries are summed on construction
+  adj = scipy.sparse.csr_array((weights, (src, dst)), shape=(n, n))
+  out_weight = np.asarray(adj.sum(axis=1), dtype=np.float64).ravel()
+  dangling = out_weight == 0
+  inv_out = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+  # Row-normalize so each node hands out its rank in proportion to edge weight
+  transition = (scipy.sparse.diags_array(inv_out) @ adj).T.tocsr()
+
+  uniform = 1.0 / n
+  x = np.full(n, uniform)
+  for _ in range(max_iter):
+    x_last = x
+    dangling_mass = x[dangling].sum()
+    x = alpha * (transition @ x + dangling_mass * uniform) + (1 - alpha) * uniform
+    if np.abs(x - x_last).sum() < n * tol:
+      break
+  return x
+
+
+def _parse_tags(
+  files: list[tuple[str, str]],
+  cache_dir: Path | None,
+) -> Iterator[tuple[list[Tag], str]]:
+  """
+  Parse files for tags, in worker processes for large batches.
+
+  Args:
+      files: (fname, rel_fname) pairs to extract tags from
+      cache_dir: Directory of the persistent tag cache, or None to skip it
+
+  Yields:
+      (tags, code) for each file, in input order
+  """
+  if len(files) < _PARALLEL_MIN_FILES:
+    for fname, rel_fname in files:
+      yield _read_tags(fname, rel_fname, cache_dir)
+    return
+
+  fnames = [fname for fname, _ in files]
+  rel_fnames = [rel_fname for _, rel_fname in files]
+  # Never fork: callers such as the navigator run this from a worker thread of
+  # a multithreaded asyncio process, where forking can deadlock
+  method = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+  )
+  mp_context = multiprocessing.get_context(method)
+  with ProcessPoolExecutor(mp_context=mp_context) as executor:
+    yield from executor.map(
+      _read_tags, fnames, rel_fnames, itertools.repeat(cache_dir), chunksize=16
+    )
+
+
+def _is_multi_word(ident: str) -> bool:
+  """
+  Check whether an identifier is snake_case, kebab-case or camelCase.
+
+  Uses C-level string operations instead of per-character Python loops.
+  """
+  if ("_" in ident or "-" in ident) and _LETTER.search(ident):
+    return True
+  # Mixed case: lowering changes an upper char, uppering changes a lower one
+  return ident.lower() != ident and ident.upper() != ident
+
+
+def _tree_sort_key(tag: Tag | tuple[str]) -> tuple[str, int, int]:
+  """
+  Sort key grouping ranked tags by file for tree rendering.
+
+  Orders like sorting the tuples themselves, where a bare ``(rel_fname,)``
+  entry precedes that file's tags, without comparing every Tag field.
+  """
+  if isinstance(tag, Tag):
+    return (tag.rel_fname, 1, tag.line)
+  return (tag[0], 0, 0)
 
 
 class RepoMap:
@@ -40,6 +191,7 @@ class RepoMap:
     root: str | None = None,
     map_tokens: int = 1024,
     verbose: bool = False,
+    cache_dir: str | Path | None = None,
   ):
     """
     Initialize the RepoMap.
@@ -48,13 +200,22 @@ class RepoMap:
         root: Root directory of the repository
         map_tokens: Maximum token budget for the generated map
         verbose: Whether to output verbose progress information
+        cache_dir: Directory for the persistent tag cache (default: no
+            disk cache; the CLI passes :func:`default_cache_dir`)
     """
     self.verbose = verbose
     self.root = root or os.getcwd()
     self.max_map_tokens = map_tokens
+    self.cache_dir = Path(cache_dir) if cache_dir else None
+    if self.cache_dir is not None:
+      prune_tags_cache(self.cache_dir)
 
     self._tree_cache: dict[tuple[str, tuple[int, ...], float | None], str] = {}
     self._tree_context_cache: dict[str, dict[str, Any]] = {}
+    # fname -> (mtime, tags), so repeat maps only reparse changed files
+    self._tags_cache: dict[str, tuple[float, list[Tag]]] = {}
+    # rel_fname -> (mtime, code) read while tagging, reused by _render_tree
+    self._file_content_cache: dict[str, tuple[float, str]] = {}
     self._warned_files: set[str] = set()
 
   def _estimate_tokens(self, text: str) -> int:
@@ -85,12 +246,53 @@ class RepoMap:
       return fname
 
   def _get_tags(self, fname: str, rel_fname: str) -> list[Tag]:
-    """Get tags for a file."""
-    code = self._read_text(fname)
-    if not code:
-      return []
+    """Get tags for a file, reusing the parse while its mtime is unchanged."""
+    mtime = self._get_mtime(fname)
+    cached = self._tags_cache.get(fname)
+    if cached is not None and cached[0] == mtime:
+      return cached[1]
+
+    tags, code = _read_tags(fname, rel_fname, self.cache_dir)
+    if mtime is not None:
+      self._tags_cache[fname] = (mtime, tags)
+      self._file_content_cache[rel_fname] = (mtime, code)
+    return tags
+
+  def _get_tags_many(self, files: list[tuple[str, str]]) -> Iterator[list[Tag]]:
+    """
+    Get tags for many files, reusing cached parses of unchanged files.
+
+    Files whose mtime differs from the cached entry (or that were never seen)
+    are parsed, in worker processes when there are enough of them.
+
+    Args:
+        files: (fname, rel_fname) pairs to extract tags from
 
-    return list(get_tags_from_code(fname, rel_fname, code))
+    Yields:
+        Tags for each file, in input order
+    """
+    mtimes = [self._get_mtime(fname) for fname, _ in files]
+    stale: list[tuple[str, str]] = []
+    for (fname, rel_fname), mtime in zip(files, mtimes, strict=True):
+      cached = self._tags_cache.get(fname)
+      if cached is None or cached[0] != mtime:
+        stale.append((fname, rel_fname))
+
+    parsed = _parse_tags(stale, self.cache_dir)
+    for (fname, rel_fname), mtime in zip(files, mtimes, strict=True):
+      cached = self._tags_cache.get(fname)
+      if cached is not None and cached[0] == mtime:
+        yield cached[1]
+        continue
+
+      tags, code = next(parsed)
+      if mtime is not None:
+        self._tags_cache[fname] = (mtime, tags)
+        self._file_content_cache[rel_fname] = (mtime, code)
+      yield tags
+
+    # Shut down any worker pool now rather than when the generator is collected
+    parsed.close()
 
   def _get_ranked_tags(
     self,
@@ -108,57 +310,72 @@ class RepoMap:
         List of ranked tags, most important first
     """
     defines: dict[str, set[str]] = defaultdict(set)
-    references: dict[str, list[str]] = defaultdict(list)
+    # ident -> referencing file -> number of references
+    references: dict[str, Counter[str]] = defaultdict(Counter)
     definitions: dict[tuple[str, str], set[Tag]] = defaultdict(set)
 
     fnames = sorted(set(fnames))
 
-    # Show progress bar for large repos
-    if len(fnames) > 100:
-      fnames_iter = tqdm(fnames, desc="Scanning repo")
-      showing_bar = True
-    else:
-      fnames_iter = fnames
-      showing_bar = False
-
-    for fname in fnames_iter:
-      if progress and not showing_bar:
-        progress(f"Processing: {fname}")
-
+    # Keep only regular files, remembering the ones that went missing
+    files: list[tuple[str, str]] = []
+    for fname in fnames:
       try:
         file_ok = Path(fname).is_file()
       except OSError:
         file_ok = False
 
       if not file_ok:
-        if fname not in self._warned_files:
-          self._warned_files.add(fname)
+        self._warned_files.add(fname)
         continue
 
-      rel_fname = self._get_rel_fname(fname)
-      tags = self._get_tags(fname, rel_fname)
+      files.append((fname, self._get_rel_fname(fname)))
 
-      for tag in tags:
-        if tag.kind == "def":
-          defines[tag.name].add(rel_fname)
-          key = (rel_fname, tag.name)
-          definitions[key].add(tag)
-        elif tag.kind == "ref":
-          references[tag.name].append(rel_fname)
+    results: Iterable[list[Tag]] = self._get_tags_many(files)
+
+    # Show progress bar for large repos
+    showing_bar = len(fnames) > 100
+    if showing_bar:
+      results = tqdm(results, total=len(files), desc="Scanning repo")
+
+    for (fname, rel_fname), tags in zip(files, results, strict=True):
+      if progress and not showing_bar:
+        progress(f"Processing: {fname}")
+
+      # Split the file's tags into def/ref columns once; every tag shares
+      # rel_fname, so each defined name only needs one set insertion
+      def_tags = [tag for tag in tags if tag.kind == "def"]
+      for tag in def_tags:
+        definitions[(rel_fname, tag.name)].add(tag)
+      for name in dict.fromkeys(tag.name for tag in def_tags):
+        defines[name].add(rel_fname)
+      ref_counts = Counter(tag.name for tag in tags if tag.kind == "ref")
+      for name, count in ref_counts.items():
+        references[name][rel_fname] += count
 
     if not references:
-      references = {k: list(v) for k, v in defines.items()}
+      references = {k: Counter(v) for k, v in defines.items()}
 
     idents = set(defines.keys()).intersection(set(references.keys()))
 
-    G: nx.MultiDiGraph[str] = nx.MultiDiGraph()
+    # Edge list of the file graph: referencer -> definer, one edge per ident
+    node_index: dict[str, int] = {}
+    edge_src: list[int] = []
+    edge_dst: list[int] = []
+    edge_weight: list[float] = []
+    edge_ident: list[str] = []
+
+    def add_edge(referencer: str, definer: str, weight: float, ident: str) -> None:
+      edge_src.append(node_index.setdefault(referencer, len(node_index)))
+      edge_dst.append(node_index.setdefault(definer, len(node_index)))
+      edge_weight.append(weight)
+      edge_ident.append(ident)
 
     # Add self-edges for definitions without references
     for ident in defines:
       if ident in references:
         continue
       for definer in defines[ident]:
-        G.add_edge(definer, definer, weight=0.1, ident=ident)  # type: ignore[reportUnknownMemberType]
+        add_edge(definer, definer, 0.1, ident)
 
     for ident in idents:
       if progress:
@@ -168,49 +385,40 @@ class RepoMap:
       mul = 1.0
 
       # Boost multi-word identifiers (likely more meaningful)
-      is_snake = ("_" in ident) and any(c.isalpha() for c in ident)
-      is_kebab = ("-" in ident) and any(c.isalpha() for c in ident)
-      is_camel = any(c.isupper() for c in ident) and any(c.islower() for c in ident)
-      if (is_snake or is_kebab or is_camel) and len(ident) >= 8:
+      if len(ident) >= 8 and _is_multi_word(ident):
         mul *= 10
       if ident.startswith("_"):
         mul *= 0.1
       if len(defines[ident]) > 5:
         mul *= 0.1
 
-      for referencer, num_refs in Counter(references[ident]).items():
+      for referencer, num_refs in references[ident].items():
         for definer in definers:
           # Scale down high frequency mentions
           num_refs_scaled = math.sqrt(num_refs)
-          G.add_edge(  # type: ignore[reportUnknownMemberType]
-            referencer, definer, weight=mul * num_refs_scaled, ident=ident
-          )
+          add_edge(referencer, definer, mul * num_refs_scaled, ident)
 
-    try:
-      ranked: dict[str, float] = nx.pagerank(G, weight="weight")
-    except ZeroDivisionError:
-      try:
-        ranked = nx.pagerank(G, weight="weight")
-      except ZeroDivisionError:
-        return []
-
-    # Distribute rank from each source node across its out edges
+    nodes = list(node_index)
+    ranked: dict[str, float] = {}
     ranked_definitions: dict[tuple[str, str], float] = defaultdict(float)
-    for src in G.nodes:  # type: ignore[reportUnknownMemberType]
-      if progress:
-        progress(f"Ranking: {src}")
-
-      src_rank = ranked[src]
-      total_weight = sum(  # type: ignore[reportUnknownMemberType]
-        data["weight"] for _, _, data in G.out_edges(src, data=True)
+    if nodes:
+      src = np.asarray(edge_src, dtype=np.intp)
+      weights = np.asarray(edge_weight, dtype=np.float64)
+      ranks = _pagerank(len(nodes), src, np.asarray(edge_dst, np.intp), weights)
+      ranked = dict(zip(nodes, ranks.tolist(), strict=True))
+
+      # Distribute rank from each source node across its out edges in one
+      # pass: each node's rank per unit of out weight, scaled by edge weight.
+      # Nodes with no out edges never appear in src, so their share stays 0
+      total_weight = np.bincount(src, weights=weights, minlength=len(nodes))
+      share = np.divide(
+        ranks, total_weight, out=np.zeros_like(ranks), where=total_weight > 0
       )
-      if total_weight == 0:
-        continue
-
-      for _, dst, data in G.out_edges(src, data=True):  # type: ignore[reportUnknownMemberType]
-        data["rank"] = src_rank * data["weight"] / total_weight
-        ident = data["ident"]
-        ranked_definitions[(dst, ident)] += data["rank"]
+      edge_rank = share[src] * weights
+      for dst, ident, rank in zip(
+        edge_dst, edge_ident, edge_rank.tolist(), strict=True
+      ):
+        ranked_definitions[(nodes[dst], ident)] += rank
 
     ranked_tags: list[Tag | tuple[str]] = []
     sorted_definitions = sorted(
@@ -248,10 +456,18 @@ class RepoMap:
       rel_fname not in self._tree_context_cache
       or self._tree_context_cache[rel_fname]["mtime"] != mtime
     ):
-      code = self._read_text(abs_fname) or ""
+      # Reuse the text read while tagging unless the file changed since
+      content = self._file_content_cache.get(rel_fname)
+      if content is not None and content[0] == mtime:
+        code = content[1]
+      else:
+        code = self._read_text(abs_fname) or ""
       if not code.endswith("\n"):
         code += "\n"
 
+      # Imported here so loading this module doesn't pull in the grammars
+      from grep_ast import TreeContext  # type: ignore[reportMissingTypeStubs]
+
       context = TreeContext(
         rel_fname,
         code,
@@ -274,29 +490,38 @@ class RepoMap:
     self._tree_cache[key] = res
     return res
 
-  def _to_tree(self, tags: list[Tag | tuple[str]]) -> str:
-    """Convert ranked tags to a tree representation."""
+  def _to_tree(self, tags: list[Tag | tuple[str]], presorted: bool = False) -> str:
+    """
+    Convert ranked tags to a tree representation.
+
+    Args:
+        tags: Ranked tags to render
+        presorted: Whether tags are already ordered by ``_tree_sort_key``
+
+    Returns:
+        Tree view of the tags' files and lines of interest
+    """
     if not tags:
       return ""
 
     cur_fname: str | None = None
     cur_abs_fname: str | None = None
     lois: list[int] | None = None
-    output = ""
+    parts: list[str] = []
 
     # Add dummy tag to flush final entry
     dummy_tag: tuple[None] = (None,)
-    for tag in [*sorted(tags), dummy_tag]:  # type: ignore[operator]
+    sorted_tags = tags if presorted else sorted(tags, key=_tree_sort_key)
+    for tag in itertools.chain(sorted_tags, (dummy_tag,)):
       this_rel_fname: str | None = tag[0]
 
       if this_rel_fname != cur_fname:
         if lois is not None and cur_abs_fname and cur_fname:
-          output += "\n"
-          output += cur_fname + ":\n"
-          output += self._render_tree(cur_abs_fname, cur_fname, lois)
+          parts += ("\n", cur_fname, ":\n")
+          parts.append(self._render_tree(cur_abs_fname, cur_fname, lois))
           lois = None
         elif cur_fname:
-          output += "\n" + cur_fname + "\n"
+          parts += ("\n", cur_fname, "\n")
 
         if isinstance(tag, Tag):
           lois = []
@@ -307,6 +532,7 @@ class RepoMap:
         lois.append(tag.line)
 
     # Truncate long lines (e.g., minified JS)
+    output = "".join(parts)
     return "\n".join([line[:100] for line in output.splitlines()]) + "\n"
 
   def get_repo_map(self, fnames: list[str]) -> str | None:
@@ -349,9 +575,14 @@ class RepoMap:
 
     self._tree_cache = {}
 
+    # Sort all tags for rendering once. Filtering that order by rank keeps
+    # every prefix sorted, so each probe is a linear pass instead of a sort
+    tree_order = sorted(range(num_tags), key=lambda i: _tree_sort_key(ranked_tags[i]))
+
     middle = min(int(max_map_tokens // 25), num_tags)
     while lower_bound <= upper_bound:
-      tree = self._to_tree(ranked_tags[:middle])
+      prefix = [ranked_tags[i] for i in tree_order if i < middle]
+      tree = self._to_tree(prefix, presorted=True)
       num_tokens = self._estimate_tokens(tree)
 
       pct_err = (
@@ -132,23 +132,27 @@ ROOT_IMPORTANT_FILES = [
   ".secrets.baseline",
 ]
 
-# Normalize the list once at module load
-_NORMALIZED_ROOT_IMPORTANT_FILES = frozenset(
-  os.path.normpath(path) for path in ROOT_IMPORTANT_FILES
-)
+# Entries are bare file names (see tests/unit/test_special.py), so they are
+# already in normalized form
+_NORMALIZED_ROOT_IMPORTANT_FILES = frozenset(ROOT_IMPORTANT_FILES)
+
+_GITHUB_WORKFLOWS_DIR = os.path.normpath(".github/workflows")
+_SEPARATORS = frozenset({"/", os.sep})
 
 
 def is_important(file_path: str) -> bool:
   """Check if a file path represents an important/special file."""
-  file_name = os.path.basename(file_path)
-  dir_name = os.path.normpath(os.path.dirname(file_path))
-  normalized_path = os.path.normpath(file_path)
+  if _SEPARATORS.isdisjoint(file_path):
+    # A bare name is already normalized and can only be a root file
+    return file_path in _NORMALIZED_ROOT_IMPORTANT_FILES
 
-  # Check for GitHub Actions workflow files
-  if dir_name == os.path.normpath(".github/workflows") and file_name.endswith(".yml"):
+  normalized_path = os.path.normpath(file_path)
+  if normalized_path in _NORMALIZED_ROOT_IMPORTANT_FILES:
     return True
 
-  return normalized_path in _NORMALIZED_ROOT_IMPORTANT_FILES
+  # Check for GitHub Actions workflow files
+  dir_name, _, file_name = normalized_path.rpartition(os.sep)
+  return dir_name == _GITHUB_WORKFLOWS_DIR and file_name.endswith(".yml")
 
 
 def filter_important_files(file_paths: list[str]) -> list[str]:
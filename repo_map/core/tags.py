@@ -7,27 +7,63 @@ from source code files.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import tempfile
+import time
 import warnings
 from importlib import resources
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+from repo_map.core.verbosity import VerbosityLevel
+
 if TYPE_CHECKING:
-  from collections.abc import Iterator
+  from collections.abc import Iterable, Iterator
+
+# Limits of the persistent tag cache, enforced by prune_tags_cache
+CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds since an entry was written
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_PRUNE_INTERVAL = 24 * 60 * 60  # seconds between prunes of one directory
+
+# Marker file, in the cache directory, whose mtime records the last prune
+_PRUNE_MARKER = ".last-prune"
+
+
+@functools.cache
+def _grep_ast() -> Any:
+  """
+  Import grep_ast and its tree-sitter bindings on first use.
+
+  They load the language grammars, which commands that import this module but
+  never extract tags (e.g. flight plan validation) shouldn't pay for.
+  """
+  # tree_sitter is throwing a FutureWarning
+  warnings.simplefilter("ignore", category=FutureWarning)
+  import grep_ast  # type: ignore[reportMissingTypeStubs]
+  import grep_ast.tsl  # type: ignore[reportMissingTypeStubs]
+
+  return grep_ast
 
-  from repo_map.core.verbosity import VerbosityLevel
 
-from grep_ast import filename_to_lang  # type: ignore[reportMissingTypeStubs]
-from pygments.lexers import guess_lexer_for_filename
-from pygments.token import Token
+def filename_to_lang(fname: str) -> str | None:
+  """Detect a file's tree-sitter language from its name, via grep_ast."""
+  return _lang_for_basename(os.path.basename(fname))
 
-# tree_sitter is throwing a FutureWarning
-warnings.simplefilter("ignore", category=FutureWarning)
-from grep_ast.tsl import (  # type: ignore[reportMissingTypeStubs]  # noqa: E402
-  USING_TSL_PACK,
-  get_language,
-  get_parser,
-)
+
+@functools.lru_cache(maxsize=4096)
+def _lang_for_basename(name: str) -> str | None:
+  """
+  Look up the language for a file name, memoized.
+
+  grep_ast's detection only looks at the base name, so the directory is left
+  out of the key and same-named files across the tree share an entry.
+  """
+  return _grep_ast().filename_to_lang(name)
 
 
 class Tag(NamedTuple):
@@ -40,6 +76,7 @@ class Tag(NamedTuple):
   kind: str  # "def" or "ref"
 
 
+@functools.lru_cache(maxsize=128)
 def get_scm_fname(lang: str, verbosity: VerbosityLevel | None = None) -> Path | None:
   """
   Get the path to the tree-sitter query file for a language.
@@ -52,11 +89,9 @@ def get_scm_fname(lang: str, verbosity: VerbosityLevel | None = None) -> Path |
           - None or other levels: Load {lang}/tags.scm (default)
 
   Returns:
-      Path to the query file, or None if not found.
+      Path to the query file, or None if not found. Results are cached per
+      (lang, verbosity), since the packaged query files don't change at runtime.
   """
-  # Import here to avoid circular dependency
-  from repo_map.core.verbosity import VerbosityLevel
-
   # Determine query file names based on verbosity (with fallbacks)
   if verbosity == VerbosityLevel.STRUCTURE:
     query_files = ["structure.scm", "tags.scm"]
@@ -99,11 +134,82 @@ def get_scm_fname(lang: str, verbosity: VerbosityLevel | None = None) -> Path |
   return None
 
 
+@functools.lru_cache(maxsize=64)
+def _compiled_query(lang: str, verbosity: VerbosityLevel | None) -> Any | None:
+  """
+  Get the compiled tags query for a language and verbosity level.
+
+  Several levels resolve to the same query file (e.g. None and IMPLEMENTATION
+  both use tags.scm), and those share a single compiled query.
+
+  Args:
+      lang: The language identifier (e.g., "python", "markdown")
+      verbosity: Optional verbosity level selecting the query file
+
+  Returns:
+      Compiled tree-sitter query, or None if the language or query is missing.
+  """
+  query_scm_path = get_scm_fname(lang, verbosity)
+  if query_scm_path is None:
+    return None
+  return _compile_query_file(lang, query_scm_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_query_file(lang: str, query_scm_path: Path) -> Any | None:
+  """
+  Load and compile a tree-sitter query file, once per process.
+
+  Args:
+      lang: The language identifier (e.g., "python", "markdown")
+      query_scm_path: Path to the .scm query file
+
+  Returns:
+      Compiled tree-sitter query, or None if the language or file is missing.
+  """
+  try:
+    language: Any = _grep_ast().tsl.get_language(lang)
+  except Exception:
+    return None
+
+  if not query_scm_path.exists():
+    return None
+
+  return language.query(query_scm_path.read_text())
+
+
+def parse_code(fname: str, code: str) -> Any | None:
+  """
+  Parse source code with the tree-sitter parser for its language.
+
+  The returned tree can be passed to :func:`get_tags_from_code` so that
+  several queries (e.g. one per verbosity level) share a single parse.
+
+  Args:
+      fname: Path to the file (for language detection)
+      code: Source code content
+
+  Returns:
+      The tree-sitter tree, or None if no parser is available.
+  """
+  lang = filename_to_lang(fname)
+  if not lang:
+    return None
+
+  try:
+    parser: Any = _grep_ast().tsl.get_parser(lang)
+  except Exception:
+    return None
+
+  return parser.parse(bytes(code, "utf-8"))
+
+
 def get_tags_from_code(
   fname: str,
   rel_fname: str,
   code: str,
   verbosity: VerbosityLevel | None = None,
+  tree: Any | None = None,
 ) -> Iterator[Tag]:
   """
   Extract tags (definitions and references) from source code.
@@ -119,6 +225,8 @@ def get_tags_from_code(
           - Level 2 (STRUCTURE): Use structure query (names only)
           - Level 3 (INTERFACE): Use interface query (names + signatures)
           - None or other levels: Use default tags query
+      tree: Optional tree from :func:`parse_code` for the same code, to skip
+          re-parsing
 
   Yields:
       Tag objects representing definitions and references
@@ -128,30 +236,27 @@ def get_tags_from_code(
     return
 
   try:
-    language: Any = get_language(lang)  # type: ignore[reportArgumentType]
-    parser: Any = get_parser(lang)  # type: ignore[reportArgumentType]
+    parser: Any = _grep_ast().tsl.get_parser(lang)
   except Exception:
     return
 
-  query_scm_path = get_scm_fname(lang, verbosity)
-  if not query_scm_path or not query_scm_path.exists():
+  query = _compiled_query(lang, verbosity)
+  if query is None:
     return
 
-  query_scm = query_scm_path.read_text()
-  tree = parser.parse(bytes(code, "utf-8"))
+  if tree is None:
+    tree = parser.parse(bytes(code, "utf-8"))
 
   # Run the tags queries
-  query = language.query(query_scm)
   captures = query.captures(tree.root_node)
 
   saw: set[str] = set()
-  all_nodes: list[tuple[Any, str]]
-  if USING_TSL_PACK:
-    all_nodes = []
-    for tag, nodes in captures.items():
-      all_nodes += [(node, tag) for node in nodes]
+  # Stream (node, tag) pairs straight from the captures without collecting them
+  all_nodes: Iterable[tuple[Any, str]]
+  if _grep_ast().tsl.USING_TSL_PACK:
+    all_nodes = ((node, tag) for tag, nodes in captures.items() for node in nodes)
   else:
-    all_nodes = list(captures)
+    all_nodes = captures
 
   for node, tag in all_nodes:
     if tag.startswith("name.definition."):
@@ -179,19 +284,189 @@ def get_tags_from_code(
   # We saw defs, without any refs
   # Some tags files only provide defs (cpp, for example)
   # Use pygments to backfill refs
+  # Only defs-only languages get here, so pygments is imported on demand
+  from pygments.lexers import guess_lexer_for_filename
+  from pygments.token import Token
+
   try:
     lexer = guess_lexer_for_filename(fname, code)
   except Exception:
     return
 
-  tokens = list(lexer.get_tokens(code))
-  tokens = [token[1] for token in tokens if token[0] in Token.Name]
+  for token_type, token in lexer.get_tokens(code):
+    if token_type in Token.Name:
+      yield Tag(
+        rel_fname=rel_fname,
+        fname=fname,
+        name=token,
+        kind="ref",
+        line=-1,
+      )
 
-  for token in tokens:
-    yield Tag(
-      rel_fname=rel_fname,
-      fname=fname,
-      name=token,
-      kind="ref",
-      line=-1,
-    )
+
+@functools.cache
+def _extractor_versions() -> str:
+  """
+  Versions of the packages that parse and tokenize code for tag extraction.
+
+  Part of the tag cache key, so upgrading the parser, its grammars or the
+  lexer invalidates entries built with the old ones.
+  """
+  versions: list[str] = []
+  for dist in ("grep-ast", "tree-sitter", "tree-sitter-language-pack", "pygments"):
+    try:
+      versions.append(f"{dist}={importlib.metadata.version(dist)}")
+    except importlib.metadata.PackageNotFoundError:
+      versions.append(f"{dist}=")
+  return ",".join(versions)
+
+
+def _tags_cache_path(
+  cache_dir: Path, code: str, lang: str, verbosity: VerbosityLevel | None
+) -> Path | None:
+  """
+  Get the cache file for a piece of code's tags.
+
+  The key covers everything the tags depend on: the code itself, the language,
+  the query file and its mtime so edited queries invalidate it, and the
+  parser and lexer package versions. Keying on the query file rather than the
+  verbosity lets levels that share a query share entries too.
+
+  Returns:
+      Path of the cache entry, or None if the language has no query file.
+  """
+  query_scm_path = get_scm_fname(lang, verbosity)
+  if query_scm_path is None:
+    return None
+  try:
+    query_mtime = query_scm_path.stat().st_mtime_ns
+  except OSError:
+    return None
+
+  digest = hashlib.blake2b(code.encode("utf-8"), digest_size=20)
+  digest.update(f"\0{lang}\0{query_scm_path.name}\0{query_mtime}".encode())
+  digest.update(f"\0{_extractor_versions()}".encode())
+  key = digest.hexdigest()
+  return cache_dir / key[:2] / f"{key[2:]}.json"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+  """Write a file via a temporary file and rename, so readers never see it torn."""
+  path.parent.mkdir(parents=True, exist_ok=True)
+  fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+  try:
+    with os.fdopen(fd, "wb") as f:
+      f.write(data)
+    os.replace(tmp, path)
+  except BaseException:
+    with contextlib.suppress(OSError):
+      os.unlink(tmp)
+    raise
+
+
+def default_cache_dir() -> Path:
+  """
+  Get the per-user directory of the persistent tag cache.
+
+  Honours ``XDG_CACHE_HOME`` and falls back to ``~/.cache``. The CLI caches
+  tags here; library callers opt in by passing a cache directory.
+  """
+  base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+  return Path(base, "repo-map", "tags")
+
+
+def prune_tags_cache(
+  cache_dir: Path,
+  max_bytes: int = CACHE_MAX_BYTES,
+  max_age: float = CACHE_MAX_AGE,
+  interval: float = CACHE_PRUNE_INTERVAL,
+) -> int:
+  """
+  Delete tag cache entries past the age or size limit.
+
+  Entries written more than ``max_age`` seconds ago are removed, then the
+  oldest of the rest until the total is within ``max_bytes``. A directory is
+  scanned at most once per ``interval`` seconds, so calling this on every run
+  is cheap. Failures are ignored: the cache is best effort.
+
+  Args:
+      cache_dir: Directory holding the cache entries
+      max_bytes: Maximum total size of the entries
+      max_age: Maximum age of an entry, in seconds
+      interval: Minimum time between scans, in seconds
+
+  Returns:
+      Number of entries removed
+  """
+  marker = cache_dir / _PRUNE_MARKER
+  now = time.time()
+  try:
+    if now - marker.stat().st_mtime < interval:
+      return 0
+  except OSError:
+    pass  # Never pruned (or no cache yet)
+
+  entries: list[tuple[float, int, Path]] = []
+  for path in cache_dir.glob("*/*.json"):
+    with contextlib.suppress(OSError):
+      st = path.stat()
+      entries.append((st.st_mtime, st.st_size, path))
+  entries.sort()
+
+  total = sum(size for _, size, _ in entries)
+  removed = 0
+  for mtime, size, path in entries:
+    if mtime >= now - max_age and total <= max_bytes:
+      break
+    with contextlib.suppress(OSError):
+      path.unlink()
+      removed += 1
+    total -= size
+
+  with contextlib.suppress(OSError):
+    marker.parent.mkdir(parents=True, exist_ok=True)
+    marker.touch()
+  return removed
+
+
+def get_tags_cached(
+  fname: str,
+  rel_fname: str,
+  code: str,
+  cache_dir: Path,
+  verbosity: VerbosityLevel | None = None,
+) -> list[Tag]:
+  """
+  Extract tags like :func:`get_tags_from_code`, backed by an on-disk cache.
+
+  Entries are keyed by a hash of the code rather than its path, so they stay
+  valid across runs and renames. Only (line, name, kind) is stored; the file
+  names are filled in from the arguments on a hit.
+
+  Args:
+      fname: Absolute path to the file
+      rel_fname: Relative path to the file (for display)
+      code: Source code content
+      cache_dir: Directory holding the cache entries
+      verbosity: Optional verbosity level for tiered query loading
+
+  Returns:
+      Tags for the code
+  """
+  lang = filename_to_lang(fname)
+  path = _tags_cache_path(cache_dir, code, lang, verbosity) if lang else None
+  if path is None:
+    return list(get_tags_from_code(fname, rel_fname, code, verbosity))
+
+  try:
+    rows = json.loads(path.read_bytes())
+    return [Tag(rel_fname, fname, line, name, kind) for line, name, kind in rows]
+  except (OSError, ValueError, TypeError):
+    pass  # Missing or unreadable entry: extract and (re)write it
+
+  tags = list(get_tags_from_code(fname, rel_fname, code, verbosity))
+  rows = [[tag.line, tag.name, tag.kind] for tag in tags]
+  with contextlib.suppress(OSError):
+    # Caching is best effort; a read-only checkout still works
+    _write_atomic(path, json.dumps(rows, separators=(",", ":")).encode("utf-8"))
+  return tags
@@ -5,14 +5,22 @@ from pathlib import Path
 import structlog
 
 
-def configure_logging() -> None:
-  """Configure structlog for normal application logging."""
+def configure_logging(level: int = logging.INFO) -> None:
+  """Configure structlog for normal application logging.
+
+  Calls below ``level`` are dropped by the bound logger itself, before any
+  processor (timestamping, rendering) runs.
+
+  Args:
+      level: Minimum standard library log level to emit
+  """
   structlog.configure(
     processors=[
       structlog.processors.TimeStamper(fmt="iso"),
       structlog.processors.add_log_level,
       structlog.dev.ConsoleRenderer(),
     ],
+    wrapper_class=structlog.make_filtering_bound_logger(level),
     context_class=dict,
     logger_factory=structlog.PrintLoggerFactory(),
   )
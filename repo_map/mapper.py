@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import functools
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pathspec
@@ -9,10 +12,14 @@ from pydantic import BaseModel, Field
 from repo_map.core import RepoMap
 
 if TYPE_CHECKING:
+  from collections.abc import Callable, Iterator
   from pathlib import Path
 
   from repo_map.core.flight_plan import FlightPlan
 
+# pathspec names a group in each pattern regex; see _spec_matcher
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
 # Opinionated defaults: Text files that are too noisy for an LLM map
 DEFAULT_EXCLUDE_PATTERNS = [
   "uv.lock",
@@ -43,37 +50,217 @@ class MapResult(BaseModel):
   """Result from repo-map generation with content and metadata."""
 
   content: str = Field(description="Rendered repository map content")
-  files: list[str] = Field(description="List of files included in the map")
+  files: list[str] = Field(
+    description="Files included in the map, sorted by relative path"
+  )
   total_tokens: int = Field(default=0, ge=0, description="Estimated token count")
   focus_areas: list[str] = Field(
     default_factory=list, description="High-verbosity file paths"
   )
 
 
+# Extensions that are text by convention; these skip the binary sniff
+_KNOWN_TEXT_EXTS = frozenset(
+  {
+    ".c",
+    ".cc",
+    ".cfg",
+    ".cpp",
+    ".cs",
+    ".css",
+    ".go",
+    ".h",
+    ".hpp",
+    ".html",
+    ".ini",
+    ".java",
+    ".js",
+    ".json",
+    ".jsx",
+    ".kt",
+    ".md",
+    ".php",
+    ".py",
+    ".rb",
+    ".rs",
+    ".rst",
+    ".scm",
+    ".sh",
+    ".sql",
+    ".swift",
+    ".toml",
+    ".ts",
+    ".tsx",
+    ".txt",
+    ".xml",
+    ".yaml",
+    ".yml",
+  }
+)
+
+
 def is_text_file(file_path: str) -> bool:
   """
   Checks if a file is text by reading the first 1024 bytes
   and looking for null bytes.
+
+  Files with a well-known text extension are trusted without being read.
   """
+  if os.path.splitext(file_path)[1].lower() in _KNOWN_TEXT_EXTS:
+    return True
   try:
-    with open(file_path, "rb") as f:
-      chunk = f.read(1024)
+    # A raw descriptor skips the buffered file object for a one-shot read
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+      chunk = os.read(fd, 1024)
+    finally:
+      os.close(fd)
     return b"\0" not in chunk
   except OSError:
     return False
 
 
+# Below this many files the binary sniff runs inline; pool startup isn't worth it
+_SNIFF_PARALLEL_MIN_FILES = 64
+
+
+def _filter_text_files(candidates: list[tuple[str, str]]) -> list[str]:
+  """
+  Keep the candidates that look like text files.
+
+  The sniff is IO-bound, so larger batches go through a thread pool to overlap
+  the reads.
+
+  Args:
+      candidates: (full_path, rel_path) pairs to check
+
+  Returns:
+      Relative paths of the text files, in input order
+  """
+  if len(candidates) < _SNIFF_PARALLEL_MIN_FILES:
+    return [rel for full, rel in candidates if is_text_file(full)]
+
+  workers = min(32, (os.cpu_count() or 1) * 4)
+  with ThreadPoolExecutor(max_workers=workers) as executor:
+    flags = executor.map(is_text_file, [full for full, _ in candidates])
+    return [rel for (_, rel), ok in zip(candidates, flags, strict=True) if ok]
+
+
+def _last_suffix(file_name: str) -> str:
+  """
+  Return the file name from its last dot onwards, or "" if it has none.
+
+  Unlike ``os.path.splitext``, a leading dot counts, so ".bashrc" yields
+  ".bashrc" just as ``endswith`` would see it.
+  """
+  dot = file_name.rfind(".")
+  return file_name[dot:] if dot >= 0 else ""
+
+
+def _walk(abs_root: str) -> Iterator[tuple[str, str, list[str], list[str]]]:
+  """
+  Walk a directory tree top-down like ``os.walk``, without following symlinks.
+
+  Entries are classified from the ``os.scandir`` results, and each directory's
+  path relative to the root is built up by concatenation instead of calling
+  ``os.path.relpath`` per file. As with ``os.walk``, removing names from the
+  yielded dirs list prunes them; symlinked directories are listed but not
+  descended into, and unreadable directories are skipped. Unlike ``os.walk``,
+  only regular files (or links to them) are listed, so broken symlinks, FIFOs
+  and sockets never reach the binary sniff.
+
+  Args:
+      abs_root: Absolute path of the directory to walk
+
+  Yields:
+      Tuples of (dir_path, rel_prefix, dirs, files), where rel_prefix is the
+      directory's relative path with a trailing separator ("" for the root)
+  """
+  stack = [(abs_root, "")]
+  while stack:
+    top, rel_prefix = stack.pop()
+    dirs: list[str] = []
+    files: list[str] = []
+    links: set[str] = set()
+    try:
+      with os.scandir(top) as entries:
+        for entry in entries:
+          try:
+            if entry.is_dir():
+              dirs.append(entry.name)
+              if entry.is_symlink():
+                links.add(entry.name)
+            elif entry.is_file():
+              files.append(entry.name)
+          except OSError:
+            continue
+    except OSError:
+      continue
+
+    yield top, rel_prefix, dirs, files
+
+    # Reversed so subdirectories are visited in listing order
+    stack.extend(
+      (os.path.join(top, d), rel_prefix + d + os.sep)
+      for d in reversed(dirs)
+      if d not in links
+    )
+
+
+def _spec_matcher(spec: pathspec.PathSpec) -> Callable[[str], bool]:
+  """
+  Build a match function equivalent to ``spec.match_file``.
+
+  Without negations a spec matches exactly when any one of its patterns does,
+  so the patterns are fused into one alternation regex and a path is matched
+  in a single call into the regex engine. Negations depend on last-match-wins
+  ordering, which an alternation can't express, so such specs keep using
+  ``match_file``.
+
+  Args:
+      spec: Compiled gitwildmatch spec
+
+  Returns:
+      Function reporting whether a relative path matches the spec
+  """
+  parts: list[str] = []
+  for pattern in spec.patterns:
+    if pattern.include is False:
+      return spec.match_file  # type: ignore[reportUnknownMemberType]
+    if pattern.include is not None:
+      # Alternatives can't repeat a group name, so make the groups anonymous
+      parts.append(_NAMED_GROUP.sub("(?:", pattern.regex.pattern))
+  union = re.compile("|".join(parts) if parts else r"(?!)")
+  return lambda rel_path: union.match(_as_posix(rel_path)) is not None
+
+
+@functools.cache
+def _default_exclude_matcher() -> Callable[[str], bool]:
+  """Match function for DEFAULT_EXCLUDE_PATTERNS, compiled once per process."""
+  return _spec_matcher(
+    pathspec.PathSpec.from_lines("gitwildmatch", DEFAULT_EXCLUDE_PATTERNS)
+  )
+
+
+def _as_posix(path: str) -> str:
+  """Convert an OS-relative path to the '/'-separated form patterns expect."""
+  return path if os.sep == "/" else path.replace(os.sep, "/")
+
+
 def generate_repomap(
   root_dir: Path,
   token_limit: int = 2048,
   include_patterns: list[str] | None = None,
   exclude_patterns: list[str] | None = None,
+  include_regex: re.Pattern[str] | None = None,
+  exclude_regex: re.Pattern[str] | None = None,
   allowed_extensions: list[str] | None = None,
   use_gitignore: bool = True,
   use_default_excludes: bool = True,
   flight_plan: FlightPlan | None = None,
   show_costs: bool = False,
   strict: bool = False,
+  cache_dir: Path | None = None,
 ) -> MapResult | None:
   """
   Generate a repository map for a given directory.
@@ -83,12 +270,17 @@ def generate_repomap(
       token_limit: Maximum token budget for the generated map
       include_patterns: Glob patterns to explicitly include
       exclude_patterns: Glob patterns to exclude
+      include_regex: Precompiled union of include_patterns; matched directly
+          instead of building a PathSpec when given
+      exclude_regex: Precompiled union of exclude_patterns; matched directly
+          instead of building a PathSpec when given
       allowed_extensions: Only include files with these extensions
       use_gitignore: Whether to respect .gitignore files
       use_default_excludes: Whether to use default exclusion patterns
       flight_plan: Optional FlightPlan configuration for multi-resolution rendering
       show_costs: Include cost annotations in output
       strict: Raise error if budget exceeded
+      cache_dir: Directory for the persistent tag cache (default: no disk cache)
 
   Returns:
       MapResult with content and files, or None if no files found
@@ -106,91 +298,115 @@ def generate_repomap(
         specs.append(pathspec.PathSpec.from_lines("gitwildmatch", f.readlines()))
 
   # 2. User Excludes
-  if exclude_patterns:
+  if exclude_patterns and exclude_regex is None:
     specs.append(pathspec.PathSpec.from_lines("gitwildmatch", exclude_patterns))
 
+  # Merge into one spec so each path is matched in a single pass. A negation only
+  # undoes matches from its own spec, so merging is skipped when a later spec
+  # could un-exclude an earlier spec's match.
+  if len(specs) > 1 and all(
+    pattern.include is not False for spec in specs[1:] for pattern in spec.patterns
+  ):
+    specs = [pathspec.PathSpec([p for spec in specs for p in spec.patterns])]
+
+  # Each spec runs as a single fused regex where its patterns allow
+  exclude_matchers = [_spec_matcher(spec) for spec in specs]
+
   # 3. Default Excludes (Opinionated)
-  default_exclude_spec = None
-  if use_default_excludes:
-    default_exclude_spec = pathspec.PathSpec.from_lines(
-      "gitwildmatch", DEFAULT_EXCLUDE_PATTERNS
-    )
+  is_default_excluded = _default_exclude_matcher() if use_default_excludes else None
 
   # 4. User Includes (Overrides excludes)
-  include_spec = None
-  if include_patterns:
-    include_spec = pathspec.PathSpec.from_lines("gitwildmatch", include_patterns)
+  include_matcher = None
+  if include_patterns and include_regex is None:
+    include_matcher = _spec_matcher(
+      pathspec.PathSpec.from_lines("gitwildmatch", include_patterns)
+    )
 
-  # --- Walk and Collect ---
-  fnames = []
+  def is_included(rel_path: str) -> bool:
+    if include_regex is not None:
+      return include_regex.search(_as_posix(rel_path)) is not None
+    return include_matcher is not None and include_matcher(rel_path)
+
+  def is_excluded(rel_path: str) -> bool:
+    if exclude_regex is not None and exclude_regex.search(_as_posix(rel_path)):
+      return True
+    return any(matches(rel_path) for matches in exclude_matchers)
+
+  def keep_dir(name: str, dir_rel: str) -> bool:
+    # Default: Skip dot-directories (hidden) unless explicitly included
+    if name.startswith(".") and name != "." and not is_included(dir_rel):
+      return False
+
+    # Check specs
+    if is_excluded(dir_rel):
+      return False
+
+    # Check default excludes
+    return not (
+      is_default_excluded is not None
+      and is_default_excluded(dir_rel)
+      and not is_included(dir_rel)
+    )
 
-  # Pre-format extensions for faster checking
+  # --- Walk and Collect ---
+  fnames: list[str] = []
+  # Paths that passed every filter but the binary sniff, which runs after the walk
+  candidates: list[tuple[str, str]] = []
+
+  # Pre-format extensions for faster checking. Single-dot extensions equal a
+  # file's last-dot suffix, so they become a set lookup; compound ones such as
+  # ".tar.gz" keep the suffix comparison.
+  ext_set: frozenset[str] = frozenset()
+  compound_exts: tuple[str, ...] = ()
   if allowed_extensions:
     allowed_extensions = [
       e if e.startswith(".") else f".{e}" for e in allowed_extensions
     ]
+    ext_set = frozenset(e for e in allowed_extensions if e.count(".") == 1)
+    compound_exts = tuple(e for e in allowed_extensions if e.count(".") > 1)
 
-  for root, dirs, files in os.walk(abs_root):
-    # A. Prune Directories
-    for i in range(len(dirs) - 1, -1, -1):
-      d = dirs[i]
-      dir_rel = os.path.relpath(os.path.join(root, d), abs_root)
-
-      # Default: Skip dot-directories (hidden) unless explicitly included
-      if d.startswith(".") and d != ".":
-        if include_spec and include_spec.match_file(dir_rel):
-          pass  # Keep it
-        else:
-          dirs.pop(i)
-          continue
-
-      # Check specs
-      if any(spec.match_file(dir_rel) for spec in specs):  # type: ignore[reportUnknownMemberType]
-        dirs.pop(i)
-        continue
-
-      # Check default excludes
-      if (
-        default_exclude_spec
-        and default_exclude_spec.match_file(dir_rel)
-        and not (include_spec and include_spec.match_file(dir_rel))
-      ):
-        dirs.pop(i)
+  for root, rel_prefix, dirs, files in _walk(str(abs_root)):
+    # A. Prune Directories (in place, so the walk skips them)
+    dirs[:] = [d for d in dirs if keep_dir(d, rel_prefix + d)]
 
     for file in files:
       full_path = os.path.join(root, file)
-      rel_path = os.path.relpath(full_path, abs_root)
+      rel_path = rel_prefix + file
 
       # --- Step 1: Check Inclusions (Highest Priority) ---
-      is_explicitly_included = include_spec and include_spec.match_file(rel_path)
+      if is_included(rel_path):
+        fnames.append(rel_path)
+        continue
 
-      if not is_explicitly_included:
-        # --- Step 2: Check Extensions (If User Provided) ---
-        if allowed_extensions and not any(
-          file.endswith(ext) for ext in allowed_extensions
-        ):
-          continue
+      # --- Step 2: Check Extensions (If User Provided) ---
+      if (
+        allowed_extensions
+        and _last_suffix(file) not in ext_set
+        and not (compound_exts and file.endswith(compound_exts))
+      ):
+        continue
 
-        # --- Step 3: Check Binary (First Principles: Don't map binaries) ---
-        # We do this BEFORE excludes to save processing, or AFTER?
-        # Doing it here ensures we don't accidentally include a binary
-        # just because it passed the exclude list.
-        if not is_text_file(full_path):
-          continue
+      # --- Step 3: Check Hard Excludes ---
+      if is_excluded(rel_path):
+        continue
 
-        # --- Step 4: Check Hard Excludes ---
-        if any(spec.match_file(rel_path) for spec in specs):  # type: ignore[reportUnknownMemberType]
-          continue
+      # --- Step 4: Check Default Excludes ---
+      if is_default_excluded is not None and is_default_excluded(rel_path):
+        continue
 
-        # --- Step 5: Check Default Excludes ---
-        if default_exclude_spec and default_exclude_spec.match_file(rel_path):
-          continue
+      candidates.append((full_path, rel_path))
 
-      fnames.append(rel_path)  # type: ignore[reportUnknownMemberType]
+  # --- Step 5: Check Binary (First Principles: Don't map binaries) ---
+  # Runs last and in bulk: the filters above are cheap, while the sniff reads
+  # from disk, so excluded files are never opened
+  fnames.extend(_filter_text_files(candidates))
 
   if not fnames:
     return None
 
+  # Sort once here so every consumer gets a stable, path-ordered file list
+  fnames.sort()
+
   # Convert relative paths to absolute for RepoMap
   abs_fnames = [str(abs_root / f) for f in fnames]
 
@@ -202,39 +418,43 @@ def generate_repomap(
 
     renderer = ContextRenderer(flight_plan=flight_plan)
 
-    # Read file contents
-    files_with_content: list[tuple[str, str]] = []
-    for rel_path in fnames:
-      abs_path: Path = abs_root / rel_path  # type: ignore[assignment]
-      try:
-        content: str = abs_path.read_text(  # type: ignore[reportUnknownMemberType]
-          encoding="utf-8", errors="replace"
-        )
-        files_with_content.append((rel_path, content))
-      except OSError:
-        continue
+    # Files are read as the renderer consumes them, instead of loading every
+    # file's content into a list before rendering starts
+    read_paths: list[str] = []
 
-    if not files_with_content:
-      return None
+    def iter_contents() -> Iterator[tuple[str, bytes]]:
+      for rel_path in fnames:
+        try:
+          # Left undecoded; the renderer decodes only what it renders
+          content = (abs_root / rel_path).read_bytes()
+        except OSError:
+          continue
+        read_paths.append(rel_path)
+        yield rel_path, content
 
     # Render with context engine
-    rendered = renderer.render(files_with_content, show_costs=show_costs, strict=strict)
+    rendered = renderer.render(iter_contents(), show_costs=show_costs, strict=strict)
+
+    if not read_paths:
+      return None
 
     # Calculate metadata
     total_tokens = estimate_tokens(rendered)
 
     # Extract focus areas (files at high verbosity: INTERFACE or IMPLEMENTATION)
     focus_areas: list[str] = []
-    for rel_path, _ in files_with_content:
+    for rel_path in read_paths:
       level = flight_plan.get_verbosity_for_path(rel_path)
       if level in (VerbosityLevel.INTERFACE, VerbosityLevel.IMPLEMENTATION):
         focus_areas.append(rel_path)
+        if len(focus_areas) == 10:  # Limit to top 10; skip resolving the rest
+          break
 
     return MapResult(
       content=rendered,
       files=fnames,
       total_tokens=total_tokens,
-      focus_areas=focus_areas[:10],  # Limit to top 10
+      focus_areas=focus_areas,
     )
 
   # Default: Use original RepoMap with PageRank
@@ -244,6 +464,7 @@ def generate_repomap(
     root=str(abs_root),
     map_tokens=token_limit,
     verbose=False,
+    cache_dir=cache_dir,
   )
 
   skeleton = repo_map.get_repo_map(abs_fnames)
@@ -15,6 +15,7 @@ Key components:
 
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -35,18 +36,21 @@ __all__ = [
 ]
 
 
-# Lazy imports to avoid circular dependencies
+# Lazy imports to avoid circular dependencies: public name -> defining module
+_LAZY_IMPORTS: dict[str, str] = {
+  "BudgetConfig": "repo_map.navigator.state",
+  "MapMetadata": "repo_map.navigator.state",
+  "NavigatorOutput": "repo_map.navigator.state",
+  "NavigatorState": "repo_map.navigator.state",
+  "TurnReport": "repo_map.navigator.state",
+}
+
+
 def __getattr__(name: str):
-  if name in ("NavigatorState", "BudgetConfig", "MapMetadata"):
-    from repo_map.navigator.state import BudgetConfig, MapMetadata, NavigatorState
-
-    return {
-      "NavigatorState": NavigatorState,
-      "BudgetConfig": BudgetConfig,
-      "MapMetadata": MapMetadata,
-    }[name]
-  if name in ("TurnReport", "NavigatorOutput"):
-    from repo_map.navigator.state import NavigatorOutput, TurnReport
-
-    return {"TurnReport": TurnReport, "NavigatorOutput": NavigatorOutput}[name]
-  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  module_name = _LAZY_IMPORTS.get(name)
+  if module_name is None:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  value = getattr(importlib.import_module(module_name), name)
+  # Cache on the module so later lookups skip __getattr__ entirely
+  globals()[name] = value
+  return value
@@ -8,17 +8,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from google.adk.agents import LlmAgent
-
 from repo_map.navigator.prompts import (
   build_prompt_context,
   load_map_content,
   render_navigator_prompt,
 )
 from repo_map.navigator.state import get_navigator_state
-from repo_map.navigator.tools import NAVIGATOR_TOOLS
 
 if TYPE_CHECKING:
+  from google.adk.agents import LlmAgent
   from google.adk.agents.readonly_context import ReadonlyContext
 
 
@@ -56,6 +54,11 @@ def create_navigator_agent(model: str = "gemini-2.0-flash") -> LlmAgent:
   Returns:
       Configured LlmAgent instance
   """
+  # ADK (and the tools built on it) load only when an agent is actually built
+  from google.adk.agents import LlmAgent
+
+  from repo_map.navigator.tools import NAVIGATOR_TOOLS
+
   return LlmAgent(
     model=model,
     name="navigator",
@@ -10,9 +10,9 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import structlog
-from google.adk.models.llm_response import LlmResponse
+
+# BasePlugin is the base class, so it is the one ADK import needed at load time
 from google.adk.plugins.base_plugin import BasePlugin
-from google.genai.types import Content, Part
 
 from repo_map.navigator.state import (
   NAVIGATOR_STATE_KEY,
@@ -22,6 +22,7 @@ from repo_map.navigator.state import (
 if TYPE_CHECKING:
   from google.adk.agents.callback_context import CallbackContext
   from google.adk.models.llm_request import LlmRequest
+  from google.adk.models.llm_response import LlmResponse
 
   from repo_map.navigator.state import NavigatorState
 
@@ -58,17 +59,17 @@ class BudgetEnforcementPlugin(BasePlugin):
 
     Uses a conservative estimate based on typical response size.
     """
-    # Estimate input tokens from request content
-    input_text = ""
-    if llm_request.contents:
-      for content in llm_request.contents:
-        if content.parts:
-          for part in content.parts:
-            if hasattr(part, "text") and part.text:
-              input_text += part.text
+    # Estimate input tokens from request content. Only the length matters, so
+    # sum it instead of concatenating the (map-sized) prompt text.
+    total_chars = sum(
+      len(text)
+      for content in llm_request.contents or ()
+      for part in content.parts or ()
+      if (text := getattr(part, "text", None))
+    )
 
     # Rough estimate: 4 chars per token
-    estimated_input_tokens = len(input_text) // 4
+    estimated_input_tokens = total_chars // 4
 
     # Use configurable conservative output estimate
     estimated_output_tokens = DEFAULT_ESTIMATED_OUTPUT_TOKENS
@@ -109,6 +110,9 @@ class BudgetEnforcementPlugin(BasePlugin):
         max_spend=state.budget_config.max_spend_usd,
       )
 
+      from google.adk.models.llm_response import LlmResponse
+      from google.genai.types import Content, Part
+
       # Return a termination response that the agent will understand
       return LlmResponse(
         content=Content(
@@ -147,8 +151,6 @@ class BudgetEnforcementPlugin(BasePlugin):
       logger.warning("no_usage_metadata_in_response")
       return None  # Don't raise - just skip cost tracking if no metadata
 
-    state = get_navigator_state(callback_context)
-
     # Extract token counts - raise if missing
     if llm_response.usage_metadata.prompt_token_count is None:
       raise ValueError("prompt_token_count is missing from usage_metadata")
@@ -158,6 +160,13 @@ class BudgetEnforcementPlugin(BasePlugin):
     input_tokens = llm_response.usage_metadata.prompt_token_count
     output_tokens = llm_response.usage_metadata.candidates_token_count
 
+    if input_tokens == 0 and output_tokens == 0:
+      # Nothing was billed, so there is no spend to add or state to persist
+      self._last_iteration_cost = Decimal(0)
+      return None
+
+    state = get_navigator_state(callback_context)
+
     # Calculate and track cost
     cost = state.budget_config.model_pricing.calculate_cost(
       input_tokens,
@@ -168,8 +177,18 @@ class BudgetEnforcementPlugin(BasePlugin):
     # Update state with new spend
     state.budget_config.current_spend_usd += cost
 
-    # Persist updated state
-    callback_context.state[NAVIGATOR_STATE_KEY] = state.model_dump(mode="json")
+    # Persist updated state. Only the spend changed, so that one leaf is patched
+    # into the stored dump instead of re-serializing the whole state (decision
+    # log, flight plan, ...); assigning a new dict still records the change.
+    stored = callback_context.state.get(NAVIGATOR_STATE_KEY)
+    if isinstance(stored, dict) and isinstance(stored.get("budget_config"), dict):
+      spend = state.budget_config.model_dump(mode="json", include={"current_spend_usd"})
+      callback_context.state[NAVIGATOR_STATE_KEY] = {
+        **stored,
+        "budget_config": {**stored["budget_config"], **spend},
+      }
+    else:
+      callback_context.state[NAVIGATOR_STATE_KEY] = state.model_dump(mode="json")
 
     logger.debug(
       "token_usage_tracked",
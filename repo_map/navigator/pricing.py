@@ -7,24 +7,51 @@ GCP billing standards.
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 
-from pydantic import BaseModel, Field
-
 # GCP billing often tracks fractional cents (micro-dollars).
 # We use 9 decimal places to ensure aggregation accuracy before rounding.
 GCP_BILLING_PRECISION = Decimal("0.000000001")
 
+_ONE_MILLION = Decimal(1_000_000)
+
 
-class ModelPricing(BaseModel):
+@dataclass(frozen=True)
+class ModelPricing:
   """Represents pricing rates and cost calculation logic for a specific LLM.
 
-  Uses Decimal for currency to avoid floating-point drift.
+  Uses Decimal for currency to avoid floating-point drift. A plain frozen
+  dataclass rather than a Pydantic model: the presets are built at import and
+  never change, and Pydantic still validates and serializes it as a field of
+  ``BudgetConfig``.
+
+  Attributes:
+      model_name: Model identifier the rates apply to
+      input_per_million: USD per 1M input tokens (must be > 0)
+      output_per_million: USD per 1M output tokens (must be > 0)
   """
 
   model_name: str
-  input_per_million: Decimal = Field(gt=0, description="USD per 1M input tokens")
-  output_per_million: Decimal = Field(gt=0, description="USD per 1M output tokens")
+  input_per_million: Decimal
+  output_per_million: Decimal
+
+  def __post_init__(self) -> None:
+    """Validate that both rates are positive."""
+    for name in ("input_per_million", "output_per_million"):
+      if not getattr(self, name) > 0:
+        raise ValueError(f"{name} must be greater than 0")
+
+  @functools.cached_property
+  def input_per_token(self) -> Decimal:
+    """USD per input token, derived once from the per-million rate."""
+    return self.input_per_million / _ONE_MILLION
+
+  @functools.cached_property
+  def output_per_token(self) -> Decimal:
+    """USD per output token, derived once from the per-million rate."""
+    return self.output_per_million / _ONE_MILLION
 
   def calculate_cost(self, input_tokens: int, output_tokens: int) -> Decimal:
     """Calculate cost in USD based on this specific model's rates.
@@ -36,14 +63,11 @@ class ModelPricing(BaseModel):
     Returns:
         Total cost quantized to 9 decimal places.
     """
-    # Convert tokens to Decimal to ensure division doesn't cast back to float
-    m_input = Decimal(input_tokens) / Decimal(1_000_000)
-    m_output = Decimal(output_tokens) / Decimal(1_000_000)
-
-    input_cost = m_input * self.input_per_million
-    output_cost = m_output * self.output_per_million
-
-    total_cost = input_cost + output_cost
+    # Decimal * int stays exact, so the precomputed per-token rates give the
+    # same result as scaling the token counts down by a million each call
+    total_cost = (
+      self.input_per_token * input_tokens + self.output_per_token * output_tokens
+    )
 
     # Quantize to match GCP internal tracking precision
     return total_cost.quantize(GCP_BILLING_PRECISION, rounding=ROUND_HALF_UP)
@@ -57,15 +81,19 @@ class PricingRegistry:
 
   def __init__(self) -> None:
     self._models: dict[str, ModelPricing] = {}
+    # Per-instance memo of resolved names, so the fuzzy scan runs once per name
+    self._resolve = functools.lru_cache(maxsize=64)(self._resolve_uncached)
 
   def register(self, pricing: ModelPricing) -> None:
     """Register a new pricing configuration."""
     self._models[pricing.model_name] = pricing
+    # A new entry can change how earlier names resolve
+    self._resolve.cache_clear()
 
   def register_batch(self, pricing_list: list[ModelPricing]) -> None:
     """Register multiple configurations at once."""
-    for p in pricing_list:
-      self.register(p)
+    self._models.update((p.model_name, p) for p in pricing_list)
+    self._resolve.cache_clear()
 
   def get_pricing(self, model_name: str) -> ModelPricing:
     """Retrieve pricing for a model. Supports exact and partial string matching.
@@ -79,6 +107,10 @@ class PricingRegistry:
     Raises:
         ValueError: If the model cannot be found.
     """
+    return self._resolve(model_name)
+
+  def _resolve_uncached(self, model_name: str) -> ModelPricing:
+    """Look up a model by exact, then partial, name match."""
     # 1. Try exact match
     if model_name in self._models:
       return self._models[model_name]
@@ -10,19 +10,32 @@ The templates live in the templates/ subdirectory.
 
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import structlog
+from jinja2 import (
+  Environment,
+  FileSystemBytecodeCache,
+  FileSystemLoader,
+  select_autoescape,
+)
+
+from repo_map.navigator.state import MAP_ARTIFACT_WRITTEN_KEY
 
 if TYPE_CHECKING:
   from google.adk.agents.readonly_context import ReadonlyContext
+  from jinja2 import BytecodeCache
 
   from repo_map.navigator.state import DecisionLogEntry, NavigatorState
 
+logger = structlog.get_logger()
+
 # Template directory relative to this module
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
@@ -30,34 +43,54 @@ TEMPLATE_DIR = Path(__file__).parent / "templates"
 def _format_number(value: int | float) -> str:
   """Format a number with thousand separators."""
   if isinstance(value, float):
-    return f"{value:,.1f}"
-  return f"{value:,}"
+    return format(value, ",.1f")
+  return format(value, ",")
 
 
 def _format_pct(value: float) -> str:
   """Format a percentage value."""
-  return f"{value:.1f}%"
+  return format(value, ".1f") + "%"
+
+
+_DECIMAL_CENT = Decimal("0.01")
 
 
 def _format_currency(value: Decimal | float) -> str:
   """Format a currency value."""
-  if isinstance(value, Decimal):
-    # Use 4 decimal places for small values, 2 for larger
-    if value < Decimal("0.01"):
-      return f"{float(value):.4f}"
-    return f"{float(value):.2f}"
-  if value < 0.01:
-    return f"{value:.4f}"
-  return f"{value:.2f}"
+  # Decimals are compared exactly; both kinds share one float conversion
+  small = value < _DECIMAL_CENT if isinstance(value, Decimal) else value < 0.01
+  amount = float(value)
+  # Use 4 decimal places for small values, 2 for larger
+  return f"{amount:.4f}" if small else f"{amount:.2f}"
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+  """Persist compiled templates between runs in Jinja's per-user temp dir.
+
+  Short-lived CLI processes then skip lexing, parsing and compiling the
+  templates after the first run; entries are keyed on the template source, so
+  edits are picked up. Returns None when no safe cache directory is available.
+  """
+  try:
+    return FileSystemBytecodeCache(pattern="__repo_map_%s.cache")
+  except (OSError, RuntimeError):
+    return None
 
 
 def _create_jinja_env() -> Environment:
-  """Create a configured Jinja2 environment."""
+  """Create a configured Jinja2 environment.
+
+  Templates ship with the package and never change at runtime, so auto-reload
+  is off: a cached template is reused without re-checking its file's mtime on
+  every ``get_template`` call.
+  """
   env = Environment(
     loader=FileSystemLoader(TEMPLATE_DIR),
     autoescape=select_autoescape(default=False),
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=_bytecode_cache(),
   )
 
   # Register custom filters
@@ -126,54 +159,46 @@ class PromptContext:
   tool_examples: str
 
 
-def get_flight_plan_schema() -> str:
-  """Generate a simplified JSON schema for FlightPlan.
+# Template variable names, read straight off the context when rendering
+_PROMPT_CONTEXT_FIELDS = tuple(f.name for f in fields(PromptContext))
 
-  Returns a human-readable schema focused on the verbosity rules
-  that the agent most commonly needs to modify.
-  """
-  # We use a simplified schema to avoid overwhelming the model
-  # The focus is on the verbosity rules which are most commonly modified
-  simplified = {
-    "type": "object",
-    "properties": {
-      "budget": {
-        "type": "integer",
-        "description": "Token budget limit (default: 20000)",
-      },
-      "verbosity": {
-        "type": "array",
-        "description": "List of verbosity rules mapping file patterns to levels",
-        "items": {
-          "type": "object",
-          "required": ["pattern", "level"],
-          "properties": {
-            "pattern": {
-              "type": "string",
-              "description": "Glob pattern (e.g., 'src/**/*.py', 'README.md')",
-            },
-            "level": {
-              "type": "integer",
-              "minimum": 0,
-              "maximum": 4,
-              "description": "Verbosity level 0-4",
-            },
+
+# Simplified FlightPlan schema shown to the model. It avoids overwhelming the
+# model and focuses on the verbosity rules, which are most commonly modified.
+_SIMPLIFIED_SCHEMA: dict[str, Any] = {
+  "type": "object",
+  "properties": {
+    "budget": {
+      "type": "integer",
+      "description": "Token budget limit (default: 20000)",
+    },
+    "verbosity": {
+      "type": "array",
+      "description": "List of verbosity rules mapping file patterns to levels",
+      "items": {
+        "type": "object",
+        "required": ["pattern", "level"],
+        "properties": {
+          "pattern": {
+            "type": "string",
+            "description": "Glob pattern (e.g., 'src/**/*.py', 'README.md')",
+          },
+          "level": {
+            "type": "integer",
+            "minimum": 0,
+            "maximum": 4,
+            "description": "Verbosity level 0-4",
           },
         },
       },
     },
-  }
-
-  return json.dumps(simplified, indent=2)
-
+  },
+}
+_FLIGHT_PLAN_SCHEMA = json.dumps(_SIMPLIFIED_SCHEMA, indent=2)
 
-def get_tool_examples() -> str:
-  """Get high-quality examples of valid update_flight_plan calls.
 
-  These examples demonstrate correct RFC 6902 JSON Patch operations
-  for common flight plan modifications.
-  """
-  examples = """
+# Worked update_flight_plan calls, one per common kind of change
+_TOOL_EXAMPLES = """
 Example 1: Add a new verbosity rule to zoom into a specific file
 ```json
 {
@@ -243,8 +268,25 @@ Example 4: Set multiple files to different verbosity levels
   ]
 }
 ```
-"""
-  return examples.strip()
+""".strip()
+
+
+def get_flight_plan_schema() -> str:
+  """Get the simplified JSON schema for FlightPlan, built once at import.
+
+  Returns a human-readable schema focused on the verbosity rules
+  that the agent most commonly needs to modify.
+  """
+  return _FLIGHT_PLAN_SCHEMA
+
+
+def get_tool_examples() -> str:
+  """Get high-quality examples of valid update_flight_plan calls.
+
+  These examples demonstrate correct RFC 6902 JSON Patch operations
+  for common flight plan modifications.
+  """
+  return _TOOL_EXAMPLES
 
 
 def _format_config_patch(patch: list[dict[str, Any]]) -> list[str]:
@@ -258,13 +300,13 @@ def _format_config_patch(patch: list[dict[str, Any]]) -> list[str]:
   """
   changes: list[str] = []
   for op in patch:
-    operation: str = str(op.get("op", ""))
     path: str = str(op.get("path", ""))
     value: Any = op.get("value")
 
     if path == "/budget":
       changes.append(f"budget → {value}")
     elif path.startswith("/verbosity"):
+      operation: str = str(op.get("op", ""))
       if operation == "add" and isinstance(value, dict):
         # value is typed as Any from JSON patch; we've verified it's a dict above
         pattern = str(value.get("pattern", "?"))  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
@@ -277,19 +319,40 @@ def _format_config_patch(patch: list[dict[str, Any]]) -> list[str]:
     elif path.startswith("/focus"):
       changes.append("focus updated")
     else:
-      # Generic path description
-      field = path.split("/")[-1] if "/" in path else path
-      changes.append(f"{field} updated")
+      # Generic path description: the last path segment (or the whole path)
+      changes.append(f"{path.rpartition('/')[2]} updated")
 
   return changes
 
 
+# Formatted changes per logged decision. The log is append-only and state is
+# re-validated from session storage every turn, so entries are keyed by their
+# step, timestamp and reasoning rather than object identity.
+_ChangesKey = tuple[int, datetime, str]
+_changes_cache: dict[_ChangesKey, tuple[str, ...]] = {}
+_CHANGES_CACHE_MAX = 1024
+
+
+def _entry_changes(entry: DecisionLogEntry) -> list[str]:
+  """Format an entry's config patch, reusing the result from earlier turns."""
+  key = (entry.step, entry.timestamp, entry.reasoning)
+  changes = _changes_cache.get(key)
+  if changes is None:
+    if len(_changes_cache) >= _CHANGES_CACHE_MAX:
+      _changes_cache.clear()
+    changes = _changes_cache[key] = tuple(_format_config_patch(entry.config_patch))
+  return list(changes)
+
+
 def transform_decision_log(
   entries: list[DecisionLogEntry],
   max_entries: int = 5,
 ) -> list[DecisionEntry]:
   """Transform decision log entries for template rendering.
 
+  Only the newest entry is new on each turn, so the formatted changes of older
+  entries are served from a cache.
+
   Args:
       entries: Raw decision log entries from state
       max_entries: Maximum number of recent entries to include
@@ -300,21 +363,15 @@ def transform_decision_log(
   if not entries:
     return []
 
-  recent = entries[-max_entries:]
-  result: list[DecisionEntry] = []
-
-  for entry in recent:
-    changes = _format_config_patch(entry.config_patch)
-    result.append(
-      DecisionEntry(
-        step=entry.step,
-        action=entry.action,
-        reasoning=entry.reasoning,
-        changes=changes,
-      )
+  return [
+    DecisionEntry(
+      step=entry.step,
+      action=entry.action,
+      reasoning=entry.reasoning,
+      changes=_entry_changes(entry),
     )
-
-  return result
+    for entry in entries[-max_entries:]
+  ]
 
 
 def build_prompt_context(
@@ -371,11 +428,27 @@ def render_navigator_prompt(ctx: PromptContext) -> str:
   Returns:
       Rendered prompt string
   """
-  from dataclasses import asdict
-
   env = get_jinja_env()
   template = env.get_template("navigator_prompt.jinja2")
-  return template.render(**asdict(ctx))
+  instructions = _render_instructions(ctx.flight_plan_schema, ctx.tool_examples)
+  # A shallow mapping is enough: the template only reads attributes, so the
+  # recursive copy asdict() makes of the history and map would be wasted
+  variables = {name: getattr(ctx, name) for name in _PROMPT_CONTEXT_FIELDS}
+  return template.render(variables, instructions=instructions)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_instructions(flight_plan_schema: str, tool_examples: str) -> str:
+  """Render the static instruction tail of the prompt.
+
+  Everything after the repository map depends only on the schema and tool
+  examples, which don't change between turns, so it is rendered once and
+  reused instead of being re-emitted by the template on every turn.
+  """
+  template = get_jinja_env().get_template("navigator_instructions.jinja2")
+  return template.render(
+    flight_plan_schema=flight_plan_schema, tool_examples=tool_examples
+  )
 
 
 async def load_map_content(context: ReadonlyContext) -> str:
@@ -387,6 +460,11 @@ async def load_map_content(context: ReadonlyContext) -> str:
   Returns:
       Map content string
   """
+  # Until a tool has saved the artifact there is nothing to load, so go
+  # straight to the initial map. Sessions without the flag still try it.
+  if context.state.get(MAP_ARTIFACT_WRITTEN_KEY) is False:
+    return _initial_map_content(context)
+
   # Try loading from artifact first (updated via tools)
   try:
     # ADK's load_artifact returns dynamic types, hence the ignores
@@ -395,11 +473,13 @@ async def load_map_content(context: ReadonlyContext) -> str:
       return str(map_artifact.text)  # pyright: ignore[reportUnknownMemberType]
   except Exception:
     # Artifact may not exist yet on first iteration - fall back to initial_map
-    import structlog
+    logger.debug("artifact_load_skipped", filename="current_map.txt")
+
+  return _initial_map_content(context)
 
-    structlog.get_logger().debug("artifact_load_skipped", filename="current_map.txt")
 
-  # Fall back to initial map from session state
+def _initial_map_content(context: ReadonlyContext) -> str:
+  """Get the initial map stored in session state, or a placeholder."""
   initial_map = context.state.get("initial_map")
   if initial_map:
     return str(initial_map)
@@ -22,6 +22,7 @@ from repo_map.navigator.agent import create_navigator_agent
 from repo_map.navigator.plugin import BudgetEnforcementPlugin
 from repo_map.navigator.pricing import get_pricing_for_model
 from repo_map.navigator.state import (
+  MAP_ARTIFACT_WRITTEN_KEY,
   NAVIGATOR_STATE_KEY,
   BudgetConfig,
   MapMetadata,
@@ -177,6 +178,7 @@ async def initialize_session(
     state={
       NAVIGATOR_STATE_KEY: initial_state.model_dump(mode="json"),
       "initial_map": initial_map,
+      MAP_ARTIFACT_WRITTEN_KEY: False,
     },
   )
 
@@ -178,6 +178,9 @@ class NavigatorStateError(Exception):
 # State key used in session.state
 NAVIGATOR_STATE_KEY = "navigator"
 
+# Session state flag: False until a tool saves the current_map.txt artifact
+MAP_ARTIFACT_WRITTEN_KEY = "map_artifact_written"
+
 
 def get_navigator_state(context: ReadonlyContext | ToolContext) -> NavigatorState:
   """Deserialize NavigatorState from session.state.
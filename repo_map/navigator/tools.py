@@ -24,6 +24,7 @@ from pydantic import BaseModel, Field
 from repo_map.core.flight_plan import FlightPlan
 from repo_map.mapper import generate_repomap
 from repo_map.navigator.state import (
+  MAP_ARTIFACT_WRITTEN_KEY,
   DecisionLogEntry,
   MapMetadata,
   get_navigator_state,
@@ -134,6 +135,7 @@ async def update_flight_plan(
     filename="current_map.txt",
     artifact=map_artifact,
   )
+  tool_context.state[MAP_ARTIFACT_WRITTEN_KEY] = True
 
   # Create map metadata from result
   map_metadata = MapMetadata(
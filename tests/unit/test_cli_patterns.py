@@ -0,0 +1,65 @@
+"""Unit tests for CLI pattern normalization."""
+
+from __future__ import annotations
+
+from pathspec import PathSpec
+
+from repo_map.cli._patterns import compile_globs, normalize_patterns
+
+
+class TestNormalizePatterns:
+  """Tests for normalize_patterns function."""
+
+  def test_none_and_empty(self) -> None:
+    """Missing or blank input should normalize to None."""
+    assert normalize_patterns(None) is None
+    assert normalize_patterns(()) is None
+    assert normalize_patterns((" , ",)) is None
+
+  def test_splits_comma_separated(self) -> None:
+    """Comma-separated values should become individual patterns."""
+    result = normalize_patterns(("src/**, *.py",))
+    assert result is not None
+    assert result.globs == ("src/**", "*.py")
+
+  def test_simple_name_expands_to_directory(self) -> None:
+    """A bare name should match the directory and everything below it."""
+    result = normalize_patterns(("tests",))
+    assert result is not None
+    assert result.globs == ("tests/", "tests/**")
+
+  def test_result_is_cached(self) -> None:
+    """Identical input should return the same cached object."""
+    assert normalize_patterns(("src/**",)) is normalize_patterns(("src/**",))
+
+  def test_expanded_names_agree_with_pathspec(self) -> None:
+    """Expanded bare names should match through the union as pathspec does."""
+    result = normalize_patterns(("tests", "*.py"))
+    assert result is not None
+    assert result.union is not None
+
+    spec = PathSpec.from_lines("gitwildmatch", result.globs)
+    for path in ("tests/test_app.py", "src/app.py", "README.md", "docs/tests.md"):
+      assert (result.union.search(path) is not None) == spec.match_file(path), path
+
+  def test_union_agrees_with_pathspec(self) -> None:
+    """The single union regex should match exactly what pathspec matches."""
+    result = normalize_patterns(("tests", "src/**/*.py, docs/"))
+    assert result is not None
+    assert result.union is not None
+
+    spec = PathSpec.from_lines("gitwildmatch", result.globs)
+    for path in ("tests/a.py", "src/x/y.py", "src/y.txt", "docs/i.md", "main.py"):
+      assert (result.union.search(path) is not None) == spec.match_file(path), path
+
+  def test_negated_pattern_has_no_union(self) -> None:
+    """Negations depend on rule order, so no union regex is built."""
+    result = normalize_patterns(("src/**", "!src/vendor/**"))
+    assert result is not None
+    assert result.union is None
+
+  def test_compile_globs_is_shared(self) -> None:
+    """The same glob set should reuse one compiled union."""
+    result = normalize_patterns(("docs/**",))
+    assert result is not None
+    assert compile_globs(("docs/**",)) is result.union
@@ -5,7 +5,9 @@ from __future__ import annotations
 from repo_map.core.cost import (
   CostManifest,
   calculate_file_costs,
+  cost_at,
   estimate_tokens,
+  estimate_tokens_batch,
   format_budget_warning,
   format_cost_annotation,
 )
@@ -37,6 +39,11 @@ class TestEstimateTokens:
     text = "x" * 400
     assert estimate_tokens(text) == 100
 
+  def test_batch_matches_single(self) -> None:
+    """Test batch estimation agrees with per-text estimation."""
+    texts = ["", "1234", "x" * 400, "def f():\n    pass\n"]
+    assert estimate_tokens_batch(texts) == [estimate_tokens(t) for t in texts]
+
 
 class TestCalculateFileCosts:
   """Test file cost calculation."""
@@ -75,6 +82,18 @@ class TestCalculateFileCosts:
     assert all(level in costs for level in VerbosityLevel)
 
 
+class TestCostAt:
+  """Test single-level cost calculation."""
+
+  def test_matches_all_levels(self) -> None:
+    """Test that each level agrees with calculate_file_costs."""
+    content = "x" * 400
+    interface = "x" * 80
+    costs = calculate_file_costs(content, interface_content=interface)
+    for level in VerbosityLevel:
+      assert cost_at(level, content, interface_content=interface) == costs[level]
+
+
 class TestFormatCostAnnotation:
   """Test cost annotation formatting."""
 
@@ -96,6 +115,11 @@ class TestFormatCostAnnotation:
     assert "L1:0" in result
     assert "L4:100" in result
 
+  def test_row_indexed_by_level(self) -> None:
+    """Test that a level-indexed row formats like the equivalent dict."""
+    result = format_cost_annotation("src/main.py", (0, 5, 50, 120, 340))
+    assert result == "# src/main.py [L1:5 L2:50 L3:120 L4:340]"
+
 
 class TestFormatBudgetWarning:
   """Test budget warning formatting."""
@@ -188,3 +212,25 @@ class TestCostManifest:
     assert len(top) == 2
     assert top[0][0] == "large.py"
     assert top[0][1] == 500
+
+  def test_readding_file_replaces_costs(self) -> None:
+    """Test that adding the same path twice keeps only the latest costs."""
+    manifest = CostManifest(budget=10000)
+    manifest.add_file(
+      "a.py", {VerbosityLevel.IMPLEMENTATION: 100}, VerbosityLevel.IMPLEMENTATION
+    )
+    manifest.add_file(
+      "a.py", {VerbosityLevel.IMPLEMENTATION: 40}, VerbosityLevel.IMPLEMENTATION
+    )
+
+    assert list(manifest.files) == ["a.py"]
+    assert manifest.files["a.py"][VerbosityLevel.IMPLEMENTATION] == 40
+    assert manifest.total_at_level(VerbosityLevel.IMPLEMENTATION) == 40
+
+  def test_add_file_with_level_indexed_row(self) -> None:
+    """Test that a level-indexed row is accepted like the equivalent dict."""
+    manifest = CostManifest(budget=10000)
+    manifest.add_file("a.py", (0, 5, 50, 120, 340), VerbosityLevel.INTERFACE)
+
+    assert manifest.actual == 120
+    assert manifest.total_at_level(VerbosityLevel.STRUCTURE) == 50
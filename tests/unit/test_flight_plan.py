@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from textwrap import dedent
 from typing import TYPE_CHECKING
 
@@ -249,6 +250,40 @@ class TestFlightPlanVerbosityMatching:
     rules = plan.get_section_rules_for_path("src/main.py")
     assert rules is None
 
+  def test_resolve_path_returns_level_and_sections(self) -> None:
+    """Test resolving level and section rules together, last match wins."""
+    plan = FlightPlan(
+      verbosity=[
+        VerbosityRule(pattern="docs/*", level=1),
+        VerbosityRule(
+          pattern="docs/*.md", sections=[SectionVerbosity(pattern="*", level=2)]
+        ),
+        VerbosityRule(pattern="docs/api.md", level=3),
+        VerbosityRule(
+          pattern="docs/api.*", sections=[SectionVerbosity(pattern="API*", level=4)]
+        ),
+      ],
+    )
+    level, sections = plan.resolve_path("docs/api.md")
+    assert level == VerbosityLevel.INTERFACE
+    assert sections is not None
+    assert sections[0].pattern == "API*"
+    assert plan.resolve_path("src/main.py") == (VerbosityLevel.IMPLEMENTATION, None)
+
+  def test_resolve_paths_matches_resolve_path(self) -> None:
+    """Test that batch resolution agrees with resolving each path."""
+    plan = FlightPlan(
+      verbosity=[
+        VerbosityRule(pattern="*.py", level=2),
+        VerbosityRule(pattern="src/core/*", level=4),
+        VerbosityRule(
+          pattern="docs/*", sections=[SectionVerbosity(pattern="*", level=1)]
+        ),
+      ],
+    )
+    paths = ["src/core/auth.py", "src/main.py", "docs/api.md", "README.md"]
+    assert plan.resolve_paths(paths) == [plan.resolve_path(p) for p in paths]
+
 
 class TestFlightPlanFileLoading:
   """Test loading FlightPlan from files."""
@@ -261,6 +296,29 @@ class TestFlightPlanFileLoading:
     plan = FlightPlan.from_yaml_file(config_file)
     assert plan.budget == 8000
 
+  def test_from_yaml_file_reloads_after_edit(self, tmp_path: Path) -> None:
+    """Test that editing the file invalidates the cached plan."""
+    config_file = tmp_path / "flight-plan.yaml"
+    config_file.write_text("budget: 8000")
+    first = FlightPlan.from_yaml_file(config_file)
+
+    config_file.write_text("budget: 9000")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert FlightPlan.from_yaml_file(config_file).budget == 9000
+    assert first.budget == 8000
+
+  def test_from_yaml_file_returns_independent_copies(self, tmp_path: Path) -> None:
+    """Test that mutating a loaded plan does not leak into later loads."""
+    config_file = tmp_path / "flight-plan.yaml"
+    config_file.write_text("budget: 8000")
+
+    plan = FlightPlan.from_yaml_file(config_file)
+    plan.budget = 1
+
+    assert FlightPlan.from_yaml_file(config_file).budget == 8000
+
   def test_from_yaml_file_not_found(self, tmp_path: Path) -> None:
     """Test FileNotFoundError when file missing."""
     with pytest.raises(FileNotFoundError):
@@ -16,6 +16,7 @@ from repo_map.navigator.agent import (
 )
 from repo_map.navigator.pricing import GEMINI_3_FLASH_PRICING
 from repo_map.navigator.state import (
+  MAP_ARTIFACT_WRITTEN_KEY,
   NAVIGATOR_STATE_KEY,
   BudgetConfig,
   DecisionLogEntry,
@@ -154,6 +155,26 @@ class TestNavigatorInstructionProvider:
     assert "Repository Map" in instruction
     assert "src/main.py" in instruction
 
+  @pytest.mark.asyncio
+  async def test_instruction_uses_initial_map_before_artifact_written(
+    self, temp_dir: str
+  ) -> None:
+    """Test that the artifact is not consulted until a tool has written it."""
+    state = create_test_state(temp_dir)
+    context = await create_test_callback_context(
+      state={
+        NAVIGATOR_STATE_KEY: state.model_dump(mode="json"),
+        "initial_map": "# Initial Map",
+        MAP_ARTIFACT_WRITTEN_KEY: False,
+      },
+      artifact_content="# Stale Artifact",
+    )
+
+    instruction = await navigator_instruction_provider(context)
+
+    assert "# Initial Map" in instruction
+    assert "# Stale Artifact" not in instruction
+
   @pytest.mark.asyncio
   async def test_instruction_raises_on_missing_state(self) -> None:
     """Test instruction raises error when state is not initialized."""
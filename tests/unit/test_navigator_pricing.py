@@ -142,6 +142,27 @@ class TestPricingRegistry:
     assert registry.get_pricing("model-a").model_name == "model-a"
     assert registry.get_pricing("model-b").model_name == "model-b"
 
+  def test_register_invalidates_cached_lookups(self) -> None:
+    """A newly registered model should win over an earlier partial match."""
+    registry = PricingRegistry()
+    registry.register(
+      ModelPricing(
+        model_name="model",
+        input_per_million=Decimal("0.10"),
+        output_per_million=Decimal("0.40"),
+      )
+    )
+    assert registry.get_pricing("model-pro").model_name == "model"
+
+    registry.register(
+      ModelPricing(
+        model_name="model-pro",
+        input_per_million=Decimal("1.00"),
+        output_per_million=Decimal("4.00"),
+      )
+    )
+    assert registry.get_pricing("model-pro").model_name == "model-pro"
+
   def test_exact_match_gemini_20_flash(self) -> None:
     """Test exact match for Gemini 2.0 Flash."""
     pricing = default_registry.get_pricing("gemini-2.0-flash")
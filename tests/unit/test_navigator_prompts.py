@@ -8,14 +8,17 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import pytest
+from jinja2 import FileSystemBytecodeCache
 
 from repo_map.core.flight_plan import FlightPlan
+from repo_map.navigator import prompts as prompts_module
 from repo_map.navigator.pricing import GEMINI_3_FLASH_PRICING
 from repo_map.navigator.prompts import (
   DecisionEntry,
   PromptContext,
   build_prompt_context,
   get_flight_plan_schema,
+  get_jinja_env,
   get_tool_examples,
   render_navigator_prompt,
   transform_decision_log,
@@ -144,6 +147,27 @@ class TestTransformDecisionLog:
     assert result[1].step == 8
     assert result[2].step == 9
 
+  def test_revalidated_entries_reuse_formatted_changes(self) -> None:
+    """Entries rebuilt from session state should hit the formatting cache."""
+    entry = DecisionLogEntry(
+      step=1,
+      action="update_flight_plan",
+      reasoning="Zoom into auth",
+      config_patch=[
+        {"op": "add", "path": "/verbosity/-", "value": {"pattern": "a.py", "level": 4}}
+      ],
+      timestamp=datetime.now(UTC),
+    )
+    first = transform_decision_log([entry])
+    cached = len(prompts_module._changes_cache)
+
+    revalidated = DecisionLogEntry.model_validate(entry.model_dump(mode="json"))
+    second = transform_decision_log([revalidated])
+
+    assert second == first
+    assert second[0].changes == ["a.py → L4"]
+    assert len(prompts_module._changes_cache) == cached
+
 
 class TestBuildPromptContext:
   """Tests for build_prompt_context function."""
@@ -391,3 +415,11 @@ class TestRenderNavigatorPrompt:
     # Check critical warning
     assert "CRITICAL" in result
     assert "Do NOT use" in result
+
+
+class TestJinjaEnvironment:
+  """Tests for the shared Jinja2 environment."""
+
+  def test_persists_compiled_templates(self) -> None:
+    """Compiled templates should be cached on disk between runs."""
+    assert isinstance(get_jinja_env().bytecode_cache, FileSystemBytecodeCache)
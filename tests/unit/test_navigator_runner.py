@@ -234,6 +234,7 @@ class TestInitializeSession:
     assert session is not None
 
     assert "initial_map" in session.state
+    assert session.state["map_artifact_written"] is False
 
 
 class TestBuildTurnReport:
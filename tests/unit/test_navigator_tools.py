@@ -28,6 +28,7 @@ from repo_map.core.flight_plan import FlightPlan, VerbosityRule
 from repo_map.mapper import MapResult
 from repo_map.navigator.pricing import GEMINI_3_FLASH_PRICING
 from repo_map.navigator.state import (
+  MAP_ARTIFACT_WRITTEN_KEY,
   NAVIGATOR_STATE_KEY,
   BudgetConfig,
   NavigatorState,
@@ -161,6 +162,7 @@ class TestUpdateFlightPlan:
     updated_state = tool_ctx.state[NAVIGATOR_STATE_KEY]
     assert len(updated_state["decision_log"]) == 1
     assert updated_state["decision_log"][0]["action"] == "update_flight_plan"
+    assert tool_ctx.state[MAP_ARTIFACT_WRITTEN_KEY] is True
 
   @pytest.mark.asyncio
   async def test_no_files_found_error(
@@ -172,6 +172,27 @@ def main():
     assert "class Calculator" in result or "Calculator" in result
     assert "def" in result or "main" in result or "add" in result
 
+  def test_levels_share_one_parse(
+    self, sample_python_code: str, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """Rendering several levels of the same content should parse it once."""
+    from repo_map.core import renderer as renderer_module
+
+    calls: list[str] = []
+    original = renderer_module.parse_code
+
+    def counting_parse(fname: str, code: str) -> object:
+      calls.append(fname)
+      return original(fname, code)
+
+    monkeypatch.setattr(renderer_module, "parse_code", counting_parse)
+    renderer = ContextRenderer()
+    for level in (VerbosityLevel.STRUCTURE, VerbosityLevel.INTERFACE):
+      renderer.render_file_at_level("calc.py", sample_python_code, level)
+    changed = sample_python_code + "\n"
+    renderer.render_file_at_level("calc.py", changed, VerbosityLevel.INTERFACE)
+    assert calls == ["calc.py", "calc.py"]
+
 
 class TestContextRendererCalculateCosts:
   """Tests for ContextRenderer.calculate_file_costs method."""
@@ -212,6 +233,16 @@ class TestContextRendererCalculateCosts:
     # IMPLEMENTATION should be highest (or equal to interface for small files)
     assert costs[VerbosityLevel.IMPLEMENTATION] >= costs[VerbosityLevel.EXISTENCE]
 
+  def test_cost_row_reuses_renders(self) -> None:
+    """Passing precomputed renders should give the same costs."""
+    content = "class Foo:\n    def bar(self):\n        return 1\n"
+    renderer = ContextRenderer()
+    renders = renderer.render_all_levels("test.py", content)
+    assert renders[VerbosityLevel.EXCLUDE] == ""
+    assert renders[VerbosityLevel.IMPLEMENTATION] == content
+    row = renderer.calculate_file_cost_row("test.py", content, renders)
+    assert row == renderer.calculate_file_cost_row("test.py", content)
+
 
 class TestContextRendererRender:
   """Tests for ContextRenderer.render method."""
@@ -248,6 +279,26 @@ class TestContextRendererRender:
     assert "readme.txt" in result
     assert "path only" in result
 
+  def test_streamed_files_match_list(self) -> None:
+    """A generator of files should render the same as a list."""
+    flight_plan = FlightPlan(
+      budget=20000,
+      verbosity=[
+        VerbosityRule(pattern="*.log", level=0),  # EXCLUDE
+        VerbosityRule(pattern="*.txt", level=1),  # EXISTENCE
+      ],
+    )
+    files = [("app.log", "log"), ("readme.txt", "text"), ("main.py", "x = 1")]
+    renderer = ContextRenderer(flight_plan=flight_plan)
+    assert renderer.render(file for file in files) == renderer.render(files)
+
+  def test_bytes_content_matches_text(self) -> None:
+    """Raw bytes should render like text read in text mode."""
+    renderer = ContextRenderer()
+    raw = "x = 'caf\u00e9'\r\ny = 2\r\n".encode()
+    text = "x = 'caf\u00e9'\ny = 2\n"
+    assert renderer.render([("a.py", raw)]) == renderer.render([("a.py", text)])
+
   def test_show_costs_includes_annotations(self) -> None:
     """show_costs=True should include cost annotations."""
     renderer = ContextRenderer()
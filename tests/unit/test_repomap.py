@@ -0,0 +1,75 @@
+"""Unit tests for PageRank-based repository mapping."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from repo_map.core.repomap import RepoMap, _pagerank
+
+if TYPE_CHECKING:
+  from collections.abc import Sequence
+  from pathlib import Path
+
+
+class TestPagerank:
+  """Tests for the sparse PageRank power iteration."""
+
+  # Parallel 0->1 edges, node 3 dangling, and 0.1 self-edges on 2 and 4
+  EDGES = (
+    (0, 1, 1.0),
+    (0, 1, 2.0),
+    (1, 2, 1.0),
+    (1, 3, 1.0),
+    (2, 0, 0.5),
+    (2, 2, 0.1),
+    (4, 4, 0.1),
+  )
+
+  @staticmethod
+  def _rank(edges: Sequence[tuple[int, int, float]]) -> np.ndarray:
+    src, dst, weights = zip(*edges, strict=True)
+    return _pagerank(5, np.array(src), np.array(dst), np.array(weights))
+
+  def test_matches_networkx_ranks(self) -> None:
+    """Ranks should equal nx.pagerank on the same MultiDiGraph."""
+    # Reference values from networkx.pagerank(G, weight="weight")
+    expected = [
+      0.16393049094788875,
+      0.19221841971776993,
+      0.15678083024332154,
+      0.13457013245708663,
+      0.35250012663393326,
+    ]
+    assert self._rank(self.EDGES).tolist() == pytest.approx(expected, abs=1e-12)
+
+  def test_ranks_sum_to_one(self) -> None:
+    """Rank held by dangling nodes should be redistributed, not lost."""
+    assert self._rank(self.EDGES).sum() == pytest.approx(1.0)
+
+  def test_parallel_edges_are_summed(self) -> None:
+    """Parallel edges should rank like one edge carrying their total weight."""
+    merged = ((0, 1, 3.0), *self.EDGES[2:])
+    assert self._rank(self.EDGES).tolist() == pytest.approx(
+      self._rank(merged).tolist(), abs=1e-12
+    )
+
+
+class TestRepoMapCacheDir:
+  """Tests for the persistent tag cache setting."""
+
+  def test_no_disk_cache_by_default(
+    self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """Without cache_dir, nothing should be written to the per-user cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    repo_map = RepoMap(root=str(tmp_path / "repo"))
+    assert repo_map.cache_dir is None
+    assert not any(tmp_path.iterdir())
+
+  def test_explicit_cache_dir(self, tmp_path: Path) -> None:
+    """An explicit cache_dir should opt in to the disk cache."""
+    repo_map = RepoMap(root=str(tmp_path), cache_dir=str(tmp_path / "tags"))
+    assert repo_map.cache_dir == tmp_path / "tags"
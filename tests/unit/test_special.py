@@ -0,0 +1,23 @@
+"""Unit tests for important file detection."""
+
+from __future__ import annotations
+
+import os
+
+from repo_map.core.special import ROOT_IMPORTANT_FILES, is_important
+
+
+class TestRootImportantFiles:
+  """Tests for the root important file list."""
+
+  def test_entries_are_bare_names(self) -> None:
+    """Entries must be bare file names, which is_important matches unnormalized."""
+    for name in ROOT_IMPORTANT_FILES:
+      assert "/" not in name, name
+      assert os.sep not in name, name
+
+  def test_bare_and_normalized_paths_agree(self) -> None:
+    """A root file should match with or without a leading ./ component."""
+    for name in ROOT_IMPORTANT_FILES:
+      assert is_important(name), name
+      assert is_important(f"./{name}"), name
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import os
+import time
+from typing import TYPE_CHECKING
+
 import pytest
 
-from repo_map.core.tags import get_scm_fname, get_tags_from_code
+from repo_map.core import tags as tags_module
+from repo_map.core.tags import (
+  default_cache_dir,
+  get_scm_fname,
+  get_tags_cached,
+  get_tags_from_code,
+  prune_tags_cache,
+)
 from repo_map.core.verbosity import VerbosityLevel
 
+if TYPE_CHECKING:
+  from pathlib import Path
+
 
 class TestGetScmFname:
   """Tests for get_scm_fname function."""
@@ -63,6 +77,17 @@ class TestGetScmFname:
     assert path.name == "tags.scm"
 
 
+class TestCompiledQuery:
+  """Tests for the compiled query cache."""
+
+  def test_levels_sharing_a_file_share_the_query(self) -> None:
+    """Levels that resolve to tags.scm should reuse one compiled query."""
+    default = tags_module._compiled_query("python", None)
+    full = tags_module._compiled_query("python", VerbosityLevel.IMPLEMENTATION)
+    assert default is not None
+    assert default is full
+
+
 class TestGetTagsFromCodeVerbosity:
   """Tests for get_tags_from_code with verbosity parameter."""
 
@@ -151,3 +176,85 @@ def main():
       )
     )
     assert len(tags) == 0
+
+
+class TestGetTagsCached:
+  """Tests for the on-disk tag cache."""
+
+  CODE = "def add(a, b):\n  return a + b\n"
+
+  def test_hit_matches_fresh_extraction(
+    self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """A cache hit should return the same tags without re-extracting."""
+    fresh = get_tags_cached("/src/a.py", "a.py", self.CODE, tmp_path)
+    assert any(tag.name == "add" for tag in fresh)
+
+    def fail(*args: object, **kwargs: object) -> None:
+      raise AssertionError("tags should come from the cache")
+
+    monkeypatch.setattr(tags_module, "get_tags_from_code", fail)
+    cached = get_tags_cached("/src/a.py", "a.py", self.CODE, tmp_path)
+    assert cached == fresh
+
+  def test_entries_are_path_independent(self, tmp_path: Path) -> None:
+    """Identical code under another name should reuse the entry."""
+    get_tags_cached("/src/a.py", "a.py", self.CODE, tmp_path)
+    moved = get_tags_cached("/src/b.py", "b.py", self.CODE, tmp_path)
+    assert moved
+    assert all(tag.rel_fname == "b.py" for tag in moved)
+    assert len(list(tmp_path.rglob("*.json"))) == 1
+
+  def test_key_covers_extractor_versions(
+    self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """Upgrading the parser or lexer should move entries to a new key."""
+    before = tags_module._tags_cache_path(tmp_path, self.CODE, "python", None)
+    monkeypatch.setattr(tags_module, "_extractor_versions", lambda: "pygments=99")
+    after = tags_module._tags_cache_path(tmp_path, self.CODE, "python", None)
+    assert before is not None
+    assert before != after
+
+
+class TestTagsCacheLocation:
+  """Tests for where and how much the tag cache stores."""
+
+  @staticmethod
+  def _entry(cache_dir: Path, name: str, size: int, age: float) -> Path:
+    path = cache_dir / "ab" / f"{name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+  def test_default_dir_is_per_user(
+    self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """The default cache should live under XDG_CACHE_HOME, not the repository."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "repo-map" / "tags"
+
+  def test_prune_removes_expired_entries(self, tmp_path: Path) -> None:
+    """Entries older than max_age should be deleted."""
+    old = self._entry(tmp_path, "old", 10, age=100)
+    new = self._entry(tmp_path, "new", 10, age=0)
+
+    assert prune_tags_cache(tmp_path, max_age=50, interval=0) == 1
+    assert not old.exists()
+    assert new.exists()
+
+  def test_prune_enforces_size_oldest_first(self, tmp_path: Path) -> None:
+    """Over max_bytes, the oldest entries should go first."""
+    paths = [self._entry(tmp_path, f"e{i}", 10, age=30 - i) for i in range(3)]
+
+    assert prune_tags_cache(tmp_path, max_bytes=20, interval=0) == 1
+    assert [path.exists() for path in paths] == [False, True, True]
+
+  def test_prune_is_throttled(self, tmp_path: Path) -> None:
+    """A second prune within the interval should not scan again."""
+    prune_tags_cache(tmp_path)
+    old = self._entry(tmp_path, "old", 10, age=100)
+
+    assert prune_tags_cache(tmp_path, max_age=50) == 0
+    assert old.exists()